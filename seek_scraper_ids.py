@@ -1,33 +1,61 @@
 import aiohttp
 import asyncio
+import concurrent.futures
 import json
+import logging
+import orjson
 import re
 import time
 import random
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from lxml import etree
+from lxml import html as lxml_html
+from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+from yarl import URL
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, HttpUrl
 import uvicorn
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import selenium package
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Module logger - debug lines are no-ops under the default log level, unlike
+# the print calls they replace which flushed stdout on every job card
+logger = logging.getLogger(__name__)
+
+# Compiled once: matches a number followed by m (minutes), h (hours) or d (days)
+_TIME_RE = re.compile(r'(\d+)\s*([mhd])')
+
+# Compiled once: captures the job id between '/job/' and the next delimiter
+_JOBID_RE = re.compile(r'/job/([^?/#]+)')
+
+# Compiled once: extracts the page number from a pagination data-automation tag
+_PAGE_NUM_RE = re.compile(r'page-(\d+)$')
+
+# Resolve the chromedriver binary once at import time. The Docker image ships
+# it at /usr/local/bin/chromedriver; only fall back to webdriver-manager
+# (which checks driver versions over the network) when that path is missing.
+CHROMEDRIVER_PATH = '/usr/local/bin/chromedriver'
+if not os.path.exists(CHROMEDRIVER_PATH):
+    try:
+        CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    except Exception as e:
+        logger.warning("Could not resolve chromedriver via webdriver-manager: %s", e)
+
 # Create the API APP
 app = FastAPI(
     title="Seek Job Cards Scraper API",
     description="A simple API to scrape job cards from Seek.com.au",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # skip the slower stdlib json encoder
 )
 
 # Define the data model for the job search
@@ -35,244 +63,399 @@ class JobSearchRequest(BaseModel):
     search_url: HttpUrl
     posted_date_limit: Optional[str] = None
 
+
+def _create_chrome_driver():
+    """
+    Create a headless Chrome driver with the anti-detection options
+
+    Returns:
+        A ready-to-use selenium Chrome driver
+    """
+    # Set up the Chrome options
+    chrome_options = uc.ChromeOptions()
+
+    chrome_options.add_argument('--ignore-certificate-errors')
+    chrome_options.add_argument('--allow-insecure-localhost')
+    chrome_options.add_argument('--ignore-ssl-errors=yes')
+    chrome_options.add_argument('--disable-web-security')
+
+    # Add headless option for server environments
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+
+    # Set user agent - Picks randomly from the list
+    chrome_options.add_argument(f"user-agent={random.choice(SeekJobCardsScraper.USER_AGENTS)}")
+
+    # Skip images, stylesheets and fonts - the job cards live in the HTML,
+    # so these assets are bandwidth and render time for nothing
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+    # undetected_chromedriver applies the anti-detection patches itself, so
+    # the manual excludeSwitches/useAutomationExtension options and the
+    # navigator.webdriver masking script are no longer needed
+    driver = uc.Chrome(
+        options=chrome_options,
+        driver_executable_path=CHROMEDRIVER_PATH,  # resolved once at import time
+        use_subprocess=False
+    )
+
+    # Set window size
+    driver.set_window_size(1200, 720)
+
+    # Block asset and tracker requests at the network layer as well
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {
+            "urls": ["*.png", "*.jpg", "*.woff*", "*google-analytics*", "*doubleclick*"]
+        })
+    except Exception as e:
+        logger.warning("Could not set CDP network blocks: %s", e)
+
+    return driver
+
+
+def _sync_fetch(driver, url: str, timeout: int) -> str:
+    """
+    Blocking page load executed on the driver's dedicated thread
+
+    Bundles get + wait + page_source into one executor submission so each
+    page fetch crosses the thread boundary once instead of three times.
+
+    Args:
+        driver: Selenium driver to load the page with
+        url: URL to load
+        timeout: Seconds to wait for the page content
+
+    Returns:
+        The raw HTML of the loaded page
+    """
+    driver.get(url)
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+    return driver.page_source
+
+
+class SeleniumDriverPool:
+    """
+    Pool of reusable headless Chrome drivers shared across API requests
+
+    Spawning Chrome costs seconds per request, so drivers are created lazily
+    up to the pool size (selenium is only a fallback path) and then recycled
+    instead of being quit after every scrape.
+    """
+
+    def __init__(self, size: int = None):
+        self.size = size or os.cpu_count() or 2
+        self._queue = asyncio.Queue()
+        self._created = 0
+        self._lock = asyncio.Lock()
+        self._drivers = []
+
+    async def acquire(self):
+        """Check out a driver, creating one if the pool is not full yet"""
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+
+        async with self._lock:
+            if self._created < self.size:
+                loop = asyncio.get_event_loop()
+                driver = await loop.run_in_executor(None, _create_chrome_driver)
+                self._created += 1
+                self._drivers.append(driver)
+                return driver
+
+        return await self._queue.get()
+
+    async def release(self, driver):
+        """
+        Return a driver to the pool after clearing per-scrape state
+
+        The reset is two blocking WebDriver round trips, so it runs in a
+        worker thread instead of on the event loop.
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self._reset, driver)
+        except Exception as e:
+            logger.warning("Error resetting pooled driver, discarding it: %s", e)
+            await self.discard(driver)
+            return
+        self._queue.put_nowait(driver)
+
+    @staticmethod
+    def _reset(driver):
+        """Clear per-scrape browser state (runs in a worker thread)"""
+        driver.delete_all_cookies()
+        driver.execute_script('window.stop()')
+
+    async def discard(self, driver):
+        """Quit a broken driver and free its slot so a new one can be created"""
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, driver.quit)
+        except Exception:
+            pass
+        if driver in self._drivers:
+            self._drivers.remove(driver)
+        self._created = max(0, self._created - 1)
+
+    def shutdown(self):
+        """Quit every pooled driver (called at app shutdown)"""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers.clear()
+        self._created = 0
+
+
+# One pool shared by every request handled by this process
+DRIVER_POOL = SeleniumDriverPool()
+
 # Create class for all the functions regarding scraping
 class SeekJobCardsScraper:
-    
-    def __init__(self, use_selenium=True):
+
+    # XPath expressions compiled once at class scope so selector parsing is
+    # not paid again for every page / card
+    CARD_XPATH = etree.XPath(
+        '//article[@data-automation="normalJob"] | //*[@data-automation="jobCard"]')
+    LINK_XPATH = etree.XPath('.//a/@href')
+    TIME_XPATH = etree.XPath(
+        './/*[@data-automation="jobListingDate"]//text() | .//span[contains(., "Posted")]//text()')
+    PAGE_XPATH = etree.XPath('//*[starts-with(@data-automation, "page-")]/@data-automation')
+    NEXT_DATA_XPATH = etree.XPath('//script[@id="__NEXT_DATA__"]/text()')
+    # Parameterized so the page number is an XPath variable, not a new
+    # expression compiled per call
+    NEXT_PAGE_XPATH = etree.XPath('//*[@data-automation=$name]/@href')
+
+    JOBS_PER_PAGE = 22  # Seek returns 22 cards per full results page
+
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15'
+    ]  # set the rotation of browsers
+
+    def __init__(self, use_selenium=False):
         """
         Initialize the scraper with base URL and headers for requests
 
         Args:
-            use_selenium: Boolean to determine to use selenium and not aiohttp
+            use_selenium: Boolean to force selenium instead of aiohttp. The search
+                pages are server-rendered, so aiohttp is the default and selenium
+                is only kept as a fallback when Seek blocks plain HTTP requests.
         """
         self.base_url = "https://www.seek.com.au"  # Define the main URL that will be used
+        self.base = URL(self.base_url)  # yarl URL for fast joins in the card loop
         self.use_selenium = use_selenium
         self.timeout = 30  # Timeout in seconds for HTTP requests
-        
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15'
-        ]  # set the rotation of browsers
-        
-        if use_selenium:
-            self._setup_selenium()
-        else:
-            # Keep the aiohttp setup as backup
-            self.headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1'
-            }
-
-    def _setup_selenium(self):
-        """
-        Set up the Selenium web driver with Chrome
-        """
-        # Set up the Chrome options
-        chrome_options = Options()
-        
-        chrome_options.add_argument('--ignore-certificate-errors')
-        chrome_options.add_argument('--allow-insecure-localhost')
-        chrome_options.add_argument('--ignore-ssl-errors=yes')
-        chrome_options.add_argument('--disable-web-security')
-
-        # Add headless option for server environments
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-
-        # Add additional privacy options to avoid detection
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # Set user agent - Picks randomly from the list
-        chrome_options.add_argument(f"user-agent={random.choice(self.user_agents)}")
-    
-        chromedriver_path = '/usr/local/bin/chromedriver'
-        
-        self.driver = webdriver.Chrome(
-            service=Service(chromedriver_path),  # change to chromedriver_path to use in sevalla
-            options=chrome_options
-        )
-            
-        # Set window size
-        self.driver.set_window_size(1200, 720)
-        
-        # Execute JavaScript to mask WebDriver presence
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")    
+        self.driver = None  # Pooled selenium driver, only checked out when needed
+        self._driver_executor = None  # One-thread executor bound to the driver
+
+        self.user_agents = self.USER_AGENTS
+
+        # Headers for the aiohttp session (the default path)
+        self.headers = {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1'
+        }
 
     async def __aenter__(self):
         """Set up resources when entering context"""
-        if not self.use_selenium:
-            # Only set up aiohttp if not using Selenium
-            self.session = aiohttp.ClientSession(headers=self.headers)
-            
+        # Cap on concurrent page fetches - this is the actual anti-rate-limit
+        # mechanism, replacing the old randomized human-behavior sleeps
+        self._fetch_sem = asyncio.Semaphore(3)
+
+        if self.use_selenium:
+            self.driver = await DRIVER_POOL.acquire()
+        else:
+            # One pooled session reused for the whole scrape, with explicit
+            # connection limits so concurrent page fetches reuse keep-alive
+            # connections instead of piling up new ones
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=30
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
             # Make an initial request to get cookies
             try:
                 async with self.session.get(self.base_url) as response:
                     if response.status == 200:
-                        print("Successfully initialized session with cookies")
+                        logger.debug("Successfully initialized session with cookies")
             except Exception as e:
-                print(f"Error initializing session: {str(e)}")
-                
+                logger.warning("Error initializing session: %s", e)
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up resources when exiting context"""
-        if self.use_selenium:
-            self.driver.quit()
-        else:
+        if self._driver_executor:
+            self._driver_executor.shutdown(wait=False)
+            self._driver_executor = None
+        if self.driver:
+            await DRIVER_POOL.release(self.driver)
+            self.driver = None
+        if not self.use_selenium:
             await self.session.close()
 
     def extract_job_id(self, url: str) -> str:
         """
         Extract job ID from URL.
-        
+
         Args:
             url: The job posting URL
-            
+
         Returns:
             The job ID extracted from the URL
         """
-        try:
-            # Find the part after 'job/' and before '?'
-            start_index = url.find('/job/') + 5  # +5 to skip '/job/'
-            end_index = url.find('?', start_index)
-            
-            if end_index == -1:  # If there's no '?', take until the end
-                return url[start_index:]
-            return url[start_index:end_index]
-        
-        except Exception as e:
-            return "Job ID not found"
+        # One scan with the precompiled pattern; a regex search on a string
+        # cannot raise, so no try/except is needed here
+        match = _JOBID_RE.search(url)
+        return match.group(1) if match else "Job ID not found"
 
-    async def fetch_page(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+    async def fetch_page(self, url: str, max_retries: int = 3) -> Optional[str]:
         """
-        Fetch a webpage and return a BeautifulSoup object using either Selenium or aiohttp
+        Fetch a webpage and return its raw HTML using either Selenium or aiohttp
+
+        The HTML is returned as a plain string so parsing can happen in the
+        process pool (strings are picklable, lxml trees are not).
         """
-        if self.use_selenium:
-            return await self._fetch_with_selenium(url, max_retries)
-        else:
-            return await self._fetch_with_aiohttp(url, max_retries)
+        async with self._fetch_sem:
+            if self.use_selenium:
+                return await self._fetch_with_selenium(url, max_retries)
+            else:
+                return await self._fetch_with_aiohttp(url, max_retries)
 
-    async def _fetch_with_selenium(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+    async def _fetch_with_selenium(self, url: str, max_retries: int = 3) -> Optional[str]:
         """
         Fetch a webpage using Selenium
         """
+        if not self.driver:
+            self.driver = await DRIVER_POOL.acquire()
+
+        # Selenium drivers are not thread-safe, so each driver gets its own
+        # single-thread executor instead of sharing the default pool
+        if self._driver_executor is None:
+            self._driver_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='selenium')
+
         for attempt in range(max_retries):
             try:
-                # Execute in an asyncio executor to avoid blocking
                 loop = asyncio.get_event_loop()
-                
-                # Load the page
-                await loop.run_in_executor(None, lambda: self.driver.get(url))
-                
-                # Add a random delay to simulate human behavior
-                await asyncio.sleep(random.uniform(2, 5))
-                
-                # Wait for the page content to load 
-                await loop.run_in_executor(
-                    None, 
-                    lambda: WebDriverWait(self.driver, self.timeout).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                )
-                
-                # Get page source
-                html = await loop.run_in_executor(None, lambda: self.driver.page_source)
-                
-                # Parse with BeautifulSoup
-                return BeautifulSoup(html, 'html.parser')
+
+                # Load + wait + read the page source in one executor hop
+                return await loop.run_in_executor(
+                    self._driver_executor, _sync_fetch, self.driver, url, self.timeout)
                 
             except TimeoutException:
-                print(f"Timeout on attempt {attempt + 1} for {url}")
+                logger.warning("Timeout on attempt %d for %s", attempt + 1, url)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                
+
             except WebDriverException as e:
-                print(f"WebDriver error on attempt {attempt + 1} for {url}: {str(e)}")
+                logger.warning("WebDriver error on attempt %d for %s: %s", attempt + 1, url, str(e))
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
-                    
-                    # Refresh the WebDriver if we encounter issues
+
+                    # Replace the WebDriver if we encounter issues
                     if "ERR_INTERNET_DISCONNECTED" in str(e) or "invalid session id" in str(e):
-                        self.driver.quit()
-                        self._setup_selenium()
-                        
+                        await DRIVER_POOL.discard(self.driver)
+                        self.driver = await DRIVER_POOL.acquire()
+
             except Exception as e:
-                print(f"Unexpected error on attempt {attempt + 1} for {url}: {str(e)}")
+                logger.warning("Unexpected error on attempt %d for %s: %s", attempt + 1, url, str(e))
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
-        
-        print(f"Failed to fetch {url} after {max_retries} attempts")
-        return None    
 
-    async def _fetch_with_aiohttp(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+        logger.warning("Failed to fetch %s after %d attempts", url, max_retries)
+        return None
+
+    async def _fetch_with_aiohttp(self, url: str, max_retries: int = 3) -> Optional[str]:
         """
-        Fetch a webpage using aiohttp (kept as a fallback)
+        Fetch a webpage using aiohttp (the default path for server-rendered pages)
         """
+        # One user agent per request, passed as a per-call override; fetches
+        # now run concurrently on this session, so its headers dict must not
+        # be mutated mid-flight
+        headers = {'User-Agent': random.choice(self.user_agents)}
         for attempt in range(max_retries):
             try:
-                # Update headers with random user agent
-                self.session.headers.update({'User-Agent': random.choice(self.user_agents)})
-                
-                async with self.session.get(url, timeout=self.timeout) as response:
+                async with self.session.get(url, headers=headers, timeout=self.timeout) as response:
                     if response.status == 200:
-                        html = await response.text()
-                        return BeautifulSoup(html, 'html.parser')
+                        return await response.text()
                     elif response.status == 403:
-                        print(f"Received 403 Forbidden. Waiting before retry.")
+                        logger.warning("Received 403 Forbidden. Waiting before retry.")
                         wait_time = 2 ** attempt  # Exponential backoff
                         await asyncio.sleep(wait_time)
                     else:
-                        print(f"Error fetching {url}: HTTP {response.status}")
+                        logger.warning("Error fetching %s: HTTP %d", url, response.status)
             except Exception as e:
-                print(f"Attempt {attempt + 1} failed: {str(e)}")
+                logger.warning("Attempt %d failed: %s", attempt + 1, e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2)
                 else:
-                    print(f"Failed after {max_retries} attempts")
+                    logger.error("Failed after %d attempts", max_retries)
                     raise
-        return None
+
+        # All plain HTTP attempts were blocked - fall back to selenium once
+        logger.warning("aiohttp attempts exhausted for %s, falling back to selenium", url)
+        return await self._fetch_with_selenium(url, max_retries)
 
         #This function will get the next page URL
-    def get_next_page_url(self, soup: BeautifulSoup, current_page: int) -> str:
+    def get_next_page_url(self, current_url: str, cards_on_page: int) -> str:
         """
         Get the URL for the next page of search results
-        
+
+        The next page URL is pure query-string arithmetic (?page=K -> K+1),
+        so no DOM walk is needed; a page with fewer cards than a full page
+        signals the end of the results instead.
+
         Args:
-            soup: BeautifulSoup object of the current page
-            current_page: Current page number
-            
+            current_url: URL of the page that was just scraped
+            cards_on_page: Number of job cards found on that page
+
         Returns:
             URL of the next page, or None if there is no next page
         """
         try:
-            next_page_num = current_page + 1
-            
-            # Look for the next page link
-            next_page_element = soup.select_one(f'[data-automation="page-{next_page_num}"]')
-            
-            if next_page_element and next_page_element.has_attr('href'):
-                href = next_page_element['href']
-                return urljoin(self.base_url, href)
-                
-            return None
-            
+            if cards_on_page < self.JOBS_PER_PAGE:
+                return None
+
+            parsed = urlparse(current_url)
+            query = parse_qs(parsed.query)
+            current_page = int(query.get('page', ['1'])[0])
+            query['page'] = [str(current_page + 1)]
+            return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
         except Exception as e:
-            print(f"Error getting next page URL: {str(e)}")
+            logger.debug("Error getting next page URL: %s", str(e))
             return None
     
     
@@ -283,7 +466,15 @@ class SeekJobCardsScraper:
         """
         if not isinstance(text, str):
             return str(text)
-    
+
+        # Fast path: a string that round-trips through a plain utf-8 encode
+        # has no surrogates, so skip the two-allocation repair below
+        try:
+            text.encode('utf-8')
+            return text
+        except UnicodeEncodeError:
+            pass
+
         # Replace surrogate pairs and other problematic characters
         try:
             # First attempt: encode with surrogateescape and decode back
@@ -302,203 +493,469 @@ class SeekJobCardsScraper:
         Returns:
             Float representing the number of days
         """
-        print(f"\nConverting posting time: {posted_time}")
-        
+        logger.debug("Converting posting time: %s", posted_time)
+
         try:
             if not posted_time or 'not found' in posted_time:
-                print("Invalid posting time, returning infinity")
+                logger.debug("Invalid posting time, returning infinity")
                 return float('inf')
-            
+
             # Remove "Posted" prefix and clean the string
             cleaned_posted_time = posted_time.lower().replace('posted', '').strip()
-            print(f"Cleaned time string: {cleaned_posted_time}")
 
             # Match a number followed by m (minutes), h (hours), or d (days)
-            match = re.match(r'(\d+)\s*([mhd])', cleaned_posted_time)
+            match = _TIME_RE.match(cleaned_posted_time)
             if not match:
-                print(f"Could not parse time format: {cleaned_posted_time}")
+                logger.debug("Could not parse time format: %s", cleaned_posted_time)
                 return float('inf')
-                        
+
             value, unit = match.groups()
             value = float(value)
-                    
+
             # Convert to days based on unit
             if unit == 'm':
                 days = value / (24 * 60)
-                print(f"Converting {value} minutes to {days:.2f} days")
             elif unit == 'h':
                 days = value / 24
-                print(f"Converting {value} hours to {days:.2f} days")
             else:  # unit == 'd'
                 days = value
-                print(f"Already in days: {days}")
-                        
+
+            logger.debug("Converted %s to %.2f days", posted_time, days)
             return days
-                    
+
         except Exception as e:
-            print(f"Error converting time: {str(e)}")
+            logger.debug("Error converting time: %s", str(e))
             return float('inf')
     
+    def _posted_date_to_days(self, posted_date: str) -> float:
+        """
+        Convert a posted date to its age in days
+
+        Handles both the ISO timestamps coming from the __NEXT_DATA__ payload
+        (e.g. "2024-05-01T03:12:45Z") and the relative "Posted 2d ago" strings
+        from the DOM fallback.
+
+        Args:
+            posted_date: String representing when the job was posted
+
+        Returns:
+            Float representing the age of the posting in days
+        """
+        try:
+            posted_at = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
+            if posted_at.tzinfo is None:
+                posted_at = posted_at.replace(tzinfo=timezone.utc)
+            return (datetime.now(timezone.utc) - posted_at).total_seconds() / 86400
+        except (ValueError, AttributeError):
+            # Not an ISO timestamp - fall back to the relative format parser
+            return self._convert_to_days(posted_date)
+
     def _is_within_time_limit(self, posted_date: str, posted_date_limit: str) -> bool:
         """
         Check if a posting time is within the specified time limit
-        
+
         Args:
             posting_time: String representing when the job was posted
             time_limit: String representing the maximum age of posts to include
-            
+
         Returns:
             Boolean indicating if the job posting is within the time limit
         """
         if not posted_date_limit:
             return True
-            
-        job_days = self._convert_to_days(posted_date)
+
+        job_days = self._posted_date_to_days(posted_date)
         limit_days = self._convert_to_days(posted_date_limit)
-        
-        print(f"Comparing job time ({job_days:.2f} days) with limit ({limit_days:.2f} days)")
+
+        logger.debug("Comparing job time (%.2f days) with limit (%.2f days)", job_days, limit_days)
         return job_days < limit_days
 
     def extract_posting_time(self, job_card) -> str:
         """
         Extract posting time from a job card element
-        
+
         Args:
-            job_card: BeautifulSoup element representing a job card
-            
+            job_card: lxml element representing a job card
+
         Returns:
             String representing when the job was posted
         """
         try:
-            # Look for the time element in the job card
-            time_element = job_card.select_one('[data-automation="jobListingDate"], .TWZc6b0, span:contains("Posted")')
-            
-            if time_element:
-                return self.sanitize_text(time_element.text.strip())
-            
-            # Alternative approach: look for spans with 'Posted' text
-            for span in job_card.select('span'):
-                text = span.text.strip()
-                if 'Posted' in text and any(unit in text for unit in ['ago', 'h', 'd', 'm']):
+            # One precompiled XPath covers both the jobListingDate attribute
+            # and any span mentioning "Posted"
+            for text in self.TIME_XPATH(job_card):
+                text = text.strip()
+                if not text:
+                    continue
+                if 'Posted' in text or any(unit in text for unit in ['ago', 'h', 'd', 'm']):
                     return self.sanitize_text(text)
-            
+
             return "Posting time not found"
-            
+
         except Exception as e:
-            print(f"Error extracting posting time: {str(e)}")
+            logger.debug("Error extracting posting time: %s", str(e))
             return "Posting time not found"
 
-    async def scrape_job_cards(self, search_url: str, posted_date_limit: str = None) -> List[Dict]:
+    def _build_page_url(self, search_url: str, page: int) -> str:
         """
-        Scrape job cards from the current search page to extract job_id and posted_date
-        
+        Build the URL for a given page number by setting the ?page= query param
+
+        Args:
+            search_url: The original search URL
+            page: Page number to build the URL for
+
+        Returns:
+            The search URL with the page parameter set
+        """
+        parsed = urlparse(search_url)
+        query = parse_qs(parsed.query)
+        query['page'] = [str(page)]
+        return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+    def _get_last_page(self, tree: lxml_html.HtmlElement) -> int:
+        """
+        Discover the last page number from the pagination links on a results page
+
+        Args:
+            tree: Parsed lxml tree of a search results page
+
+        Returns:
+            The highest page number linked in the pagination, or 1 if none found
+        """
+        last_page = 1
+        try:
+            for automation in self.PAGE_XPATH(tree):
+                match = _PAGE_NUM_RE.match(automation)
+                if match:
+                    last_page = max(last_page, int(match.group(1)))
+        except Exception as e:
+            logger.debug("Error discovering last page: %s", str(e))
+        return last_page
+
+    def _parse_next_data_jobs(self, tree: lxml_html.HtmlElement) -> List[Dict]:
+        """
+        Extract job cards from the Next.js JSON payload embedded in the page
+
+        Seek embeds the full job list as JSON in <script id="__NEXT_DATA__">,
+        which gives job_id and an ISO listing date directly without walking
+        the DOM per card.
+
+        Args:
+            tree: Parsed lxml tree of a search results page
+
+        Returns:
+            List of dictionaries containing job_id, posted_date and url,
+            or an empty list if the payload is missing or has moved
+        """
+        try:
+            payloads = self.NEXT_DATA_XPATH(tree)
+            if not payloads:
+                return []
+
+            return self._cards_from_search_data(orjson.loads(payloads[0]))
+
+        except Exception as e:
+            logger.debug("Error parsing __NEXT_DATA__ payload: %s", str(e))
+            return []
+
+    def _cards_from_search_data(self, data: Dict) -> List[Dict]:
+        """
+        Build card dicts from a decoded __NEXT_DATA__ payload
+
+        Args:
+            data: Decoded Next.js JSON payload
+
+        Returns:
+            List of dictionaries containing job_id, posted_date and url
+        """
+        jobs = (data.get('props', {})
+                    .get('pageProps', {})
+                    .get('searchResult', {})
+                    .get('jobs') or [])
+
+        page_cards = []
+        for job in jobs:
+            job_id = job.get('id')
+            if job_id is None:
+                continue
+            page_cards.append({
+                'job_id': str(job_id),
+                'posted_date': job.get('listingDate', 'Posting time not found'),
+                'url': f"{self.base_url}/job/{job_id}"})
+        return page_cards
+
+    def _parse_job_cards(self, tree: lxml_html.HtmlElement) -> List[Dict]:
+        """
+        Extract job_id, posted_date and url from every job card on a page
+
+        The embedded __NEXT_DATA__ JSON is tried first since it is a single
+        O(1) lookup; the DOM walk is kept as a fallback for when Seek changes
+        the payload shape.
+
+        Args:
+            tree: Parsed lxml tree of a search results page
+
+        Returns:
+            List of dictionaries containing job_id, posted_date and url
+        """
+        page_cards = self._parse_next_data_jobs(tree)
+        if page_cards:
+            logger.debug("Found %d job cards in __NEXT_DATA__", len(page_cards))
+            return page_cards
+
+        job_cards = self.CARD_XPATH(tree)
+        logger.debug("Found %d job cards on the page", len(job_cards))
+
+        for card in job_cards:
+            try:
+                # Get the job link
+                hrefs = self.LINK_XPATH(card)
+                if not hrefs:
+                    continue
+
+                job_url = str(self.base.join(URL(hrefs[0])))
+                job_id = self.extract_job_id(job_url)
+
+                # Extract posting time directly from the job card
+                posted_date = self.extract_posting_time(card)
+
+                page_cards.append({
+                    'job_id': job_id,
+                    'posted_date': posted_date,
+                    'url': job_url})
+
+            except Exception as e:
+                logger.debug("Error processing job card: %s", str(e))
+                continue
+
+        return page_cards
+
+    async def iter_job_cards(self, search_url: str, posted_date_limit: str = None):
+        """
+        Yield job cards one at a time as result pages are fetched and parsed
+
+        Page 1 streams as soon as it is parsed; the remaining pages are
+        fetched concurrently and yielded in page order, so the newest-first
+        ordering (and the posted-date early exit) is preserved while the
+        first results are available long before the slowest page lands.
+
         Args:
             search_url: Search URL to scrape
             posted_date_limit: Only include jobs posted within this time frame (e.g., "1d ago")
-            
-        Returns:
-            List of dictionaries containing job_id and posted_date
+
+        Yields:
+            Dictionaries containing job_id, posted_date and url
         """
         try:
-            print(f"Starting job cards scrape with search URL: {search_url}")
-            
-            job_cards_data = []
-            current_page = 1
-            job_scraped = 0
-            current_url = search_url
-            
-            while True:
-                print(f"Scraping page {current_page}")
+            logger.debug("Starting job cards scrape with search URL: %s", search_url)
+
+            loop = asyncio.get_event_loop()
 
-                # Fetch the current page with retries
-                soup = await self.fetch_page(current_url, max_retries=3)
-                if not soup:
-                    print("Failed to get BS object")
+            async def fetch_and_parse(page_n: int) -> List[Dict]:
+                page_url = self._build_page_url(search_url, page_n)
+                logger.debug("Scraping page %d", page_n)
+                html = await self.fetch_page(page_url, max_retries=3)
+                if not html:
+                    logger.warning("Failed to fetch page %d", page_n)
                     return []
-                
-                # Find all job cards
-                job_cards = soup.select('article[data-automation="normalJob"], [data-automation="jobCard"]')
-                print(f"Found {len(job_cards)} job cards on the page")
-
-                # Process each job card
-                for card in job_cards:
-                    
-                    try:
-                        # Get the job link
-                        link_element = card.select_one('a')
-                        if not link_element or not link_element.has_attr('href'):
-                            continue
-
-                        href = link_element['href']
-                        job_url = urljoin(self.base_url, href)
-                        job_id = self.extract_job_id(job_url)
-                        print(f"\n Processing job: {job_scraped +1}")
-                        
-                        # Extract posting time directly from the job card
-                        posted_date = self.extract_posting_time(card)
-                                                                      
-                        # Check if job is within time limit
-                        if posted_date_limit and not self._is_within_time_limit(posted_date, posted_date_limit):
-                                print(f"Job outside time limit, skipping")
-                                return job_cards_data   
-                            
-                            # Add to results
-                        job_cards_data.append({
-                                'job_id': job_id,
-                                'posted_date': posted_date,
-                                'url': job_url}) 
-                            
-                        job_scraped += 1
-                        print(f"Successfully scraped")
-                            
-                    except Exception as e:
-                        print(f"Error processing job card: {str(e)}")
-                        continue
-
-
-                # Add a random delay between pages
-                await asyncio.sleep(random.uniform(3, 7))        
-            
-                next_page_url = self.get_next_page_url(soup, current_page)
-                if not next_page_url:
-                    print("No next page found, ending scrape")
-                    break
-            
-                current_url = next_page_url
-                current_page += 1
-                await asyncio.sleep(1)  # Small delay between pages to avoid rate limiting
+                parsed = await loop.run_in_executor(_PARSER_POOL, _parse_page, html)
+                return parsed['cards']
+
+            # Fetch page 1 first to discover how many pages there are
+            html = await self.fetch_page(search_url, max_retries=3)
+            if not html:
+                logger.warning("Failed to fetch first page")
+                return
+
+            parsed = await loop.run_in_executor(_PARSER_POOL, _parse_page, html)
+            last_page = parsed['last_page']
+            logger.debug("Found %d result pages", last_page)
+
+            page_cache = {1: parsed['cards']}
+
+            # Stream page 1 right away
+            for card in page_cache[1]:
+                if posted_date_limit and not self._is_within_time_limit(card['posted_date'], posted_date_limit):
+                    logger.debug("Job outside time limit, stopping")
+                    return
+                yield card
 
-            return job_cards_data
+            # Fallback when the pagination links are missing from the DOM:
+            # keep incrementing the page query param until a short page
+            # signals the end of the results
+            if last_page == 1 and len(page_cache[1]) >= self.JOBS_PER_PAGE:
+                page_n = 1
+                next_url = self.get_next_page_url(search_url, len(page_cache[1]))
+                while next_url:
+                    page_n += 1
+                    logger.debug("Scraping page %d (sequential fallback)", page_n)
+                    html = await self.fetch_page(next_url, max_retries=3)
+                    if not html:
+                        break
+                    parsed = await loop.run_in_executor(_PARSER_POOL, _parse_page, html)
+                    for card in parsed['cards']:
+                        if posted_date_limit and not self._is_within_time_limit(card['posted_date'], posted_date_limit):
+                            logger.debug("Job outside time limit, stopping")
+                            return
+                        yield card
+                    next_url = self.get_next_page_url(next_url, len(parsed['cards']))
+                return
+
+            async def get_page(page_n: int) -> List[Dict]:
+                if page_n not in page_cache:
+                    page_cache[page_n] = await fetch_and_parse(page_n)
+                return page_cache[page_n]
+
+            if posted_date_limit and last_page > 1:
+                # Seek returns newest first, so binary-search for the last
+                # page whose first card is still inside the limit instead of
+                # pulling every page and bailing when one card falls outside
+                lo, hi = 1, last_page
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    cards = await get_page(mid)
+                    if cards and self._is_within_time_limit(cards[0]['posted_date'], posted_date_limit):
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                last_page = lo
+                logger.debug("Date limit boundary is page %d", last_page)
+
+            # Launch the remaining pages concurrently (the fetch semaphore
+            # throttles them), then yield each page's cards in page order as
+            # soon as that page has landed
+            tasks = {p: asyncio.ensure_future(get_page(p)) for p in range(2, last_page + 1)}
+            try:
+                for page_n in range(2, last_page + 1):
+                    for card in await tasks[page_n]:
+                        if posted_date_limit and not self._is_within_time_limit(card['posted_date'], posted_date_limit):
+                            logger.debug("Job outside time limit, stopping")
+                            return
+                        yield card
+            finally:
+                for task in tasks.values():
+                    if not task.done():
+                        task.cancel()
 
         except Exception as e:
-            print(f"Error in scrape_job_cards: {str(e)}")
-            return []
+            logger.warning("Error in iter_job_cards: %s", str(e))
+            return
+
+    async def scrape_job_cards(self, search_url: str, posted_date_limit: str = None) -> List[Dict]:
+        """
+        Scrape job cards from all search result pages into a list
 
+        Thin collector over iter_job_cards for callers that want the whole
+        result set at once (e.g. save_to_json).
 
-async def save_to_json(self, jobs_data: List[Dict], filename: str = 'seek_job_cards.json'):
+        Args:
+            search_url: Search URL to scrape
+            posted_date_limit: Only include jobs posted within this time frame (e.g., "1d ago")
+
+        Returns:
+            List of dictionaries containing job_id and posted_date
+        """
+        return [card async for card in self.iter_job_cards(search_url, posted_date_limit)]
+
+    async def save_to_json(self, jobs_data: List[Dict], filename: str = 'seek_job_cards.json'):
         """
         Save scraped job data to a JSON file
-        
+
         Args:
             jobs_data: List of job data dictionaries
             filename: Name of the output JSON file
         """
-        # Ensure all job details are fully resolved
-        scraped_jobs = []
-        for job in jobs_data:
-            # Create a new dict with resolved values
-            scraped_job = {}
-            for key, value in job.items():
-                if key == 'posted_date':
-                    # Ensure these values are strings
-                    scraped_job[key] = self.sanitize_text(value)
+        # Only posted_date needs sanitizing, so one comprehension replaces
+        # the per-key reconstruction loop
+        scraped_jobs = [
+            {**job, 'posted_date': self.sanitize_text(job['posted_date'])}
+            if 'posted_date' in job else job
+            for job in jobs_data
+        ]
+
+        # orjson writes raw UTF-8 bytes directly, several times faster than
+        # the stdlib encoder on large result lists
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(scraped_jobs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        logger.info("Saved %d job cards to %s", len(scraped_jobs), filename)
+
+
+# Scraper reused inside each parser-pool worker process; constructing it is
+# cheap since no driver or HTTP session is opened outside the context manager
+_WORKER_SCRAPER = None
+
+
+def _slice_next_data(html: str) -> Optional[str]:
+    """
+    Slice the __NEXT_DATA__ JSON payload straight out of the raw HTML
+
+    String slicing skips the full-document parse entirely when the payload
+    is present (the lxml equivalent of a bs4 SoupStrainer: only the subtree
+    we care about is ever materialized).
+
+    Args:
+        html: Raw HTML of a search results page
+
+    Returns:
+        The JSON payload string, or None if the script tag is missing
+    """
+    start = html.find('<script id="__NEXT_DATA__"')
+    if start == -1:
+        return None
+    start = html.find('>', start) + 1
+    end = html.find('</script>', start)
+    if start == 0 or end == -1:
+        return None
+    return html[start:end]
+
+
+def _parse_page(html: str) -> Dict:
+    """
+    Parse one search results page inside a parser-pool worker process
+
+    Args:
+        html: Raw HTML of a search results page
+
+    Returns:
+        Dictionary with the plain (picklable) card dicts and the last page
+        number discovered from the payload or the pagination links
+    """
+    global _WORKER_SCRAPER
+    if _WORKER_SCRAPER is None:
+        _WORKER_SCRAPER = SeekJobCardsScraper()
+
+    # Fast path: read the cards from the sliced JSON payload without ever
+    # building a DOM tree for the document
+    payload = _slice_next_data(html)
+    if payload:
+        try:
+            data = orjson.loads(payload)
+            cards = _WORKER_SCRAPER._cards_from_search_data(data)
+            if cards:
+                total = (data.get('props', {})
+                             .get('pageProps', {})
+                             .get('searchResult', {})
+                             .get('totalCount'))
+                if isinstance(total, int) and total > 0:
+                    last_page = -(-total // SeekJobCardsScraper.JOBS_PER_PAGE)
                 else:
-                    scraped_job[key] = value
-            scraped_jobs.append(scraped_job)
+                    # Payload had no total - read the pagination links instead
+                    last_page = _WORKER_SCRAPER._get_last_page(lxml_html.fromstring(html))
+                return {'cards': cards, 'last_page': last_page}
+        except Exception as e:
+            logger.debug("Error parsing sliced __NEXT_DATA__ payload: %s", str(e))
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(scraped_jobs, f, ensure_ascii=False, indent=2)
-        print(f"\nSaved {len(scraped_jobs)} job cards to {filename}")
+    tree = lxml_html.fromstring(html)
+    return {
+        'cards': _WORKER_SCRAPER._parse_job_cards(tree),
+        'last_page': _WORKER_SCRAPER._get_last_page(tree),
+    }
+
+
+# One parser pool shared by every request handled by this process (like
+# DRIVER_POOL). Per-request pools paid the worker startup cost on every
+# /scrape call and forked from a server that already had live threads.
+_PARSER_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=4)
 
 
 # Creates a directory to save the results if it doesnt exists
@@ -508,6 +965,23 @@ os.makedirs(RESULTS_DIR, exist_ok=True)
 
 # Define the API endpoints
 
+@app.on_event("startup")
+async def startup_parser_pool():
+    """Fork the parser workers before the server accumulates threads"""
+    loop = asyncio.get_event_loop()
+    try:
+        await loop.run_in_executor(_PARSER_POOL, os.getpid)
+    except Exception as e:
+        logger.warning("Error pre-warming parser pool: %s", e)
+
+
+@app.on_event("shutdown")
+async def shutdown_driver_pool():
+    """Quit every pooled Chrome driver and the parser workers when the API stops"""
+    DRIVER_POOL.shutdown()
+    _PARSER_POOL.shutdown(wait=False)
+
+
 @app.get("/")
 async def root():
     """Root endpoint that returns basic API information"""
@@ -530,48 +1004,24 @@ async def health_check():
 async def scrape_job_cards_endpoint(request: JobSearchRequest):
     """
     Endpoint to scrape job cards based on search criteria
-    
-    Returns the scraped job cards data directly in the response
-    """
-    try:
-        start_time = time.time()    
-
-        # Run the scraper
-        async with SeekJobCardsScraper(use_selenium=True) as scraper:
-            jobs_data = await scraper.scrape_job_cards(
-                str(request.search_url),
-                posted_date_limit=request.posted_date_limit
-            )
 
-        elapsed_time = time.time() - start_time
-        
-        # Ensure all values are properly serializable
-        serializable_jobs = []
-        for job in jobs_data:
-            serializable_job = {}
-            for key, value in job.items():
-                # Use sanitize_text for string values
-                if isinstance(value, str):
-                    serializable_job[key] = scraper.sanitize_text(value)
-                elif isinstance(value, (type, object)) and not isinstance(value, (int, float, bool, str, list, dict, type(None))):
-                    serializable_job[key] = str(value)
-                else:
-                    serializable_job[key] = value
+    Streams the scraped job cards as NDJSON (one JSON object per line), so
+    clients can start processing cards before the last page is fetched and
+    the server never holds the whole result set in memory.
+    """
+    async def ndjson_stream():
+        try:
+            async with SeekJobCardsScraper() as scraper:
+                async for card in scraper.iter_job_cards(
+                    str(request.search_url),
+                    posted_date_limit=request.posted_date_limit
+                ):
+                    yield orjson.dumps(card) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            yield orjson.dumps({"status": "error", "detail": f"Scraping failed: {str(e)}"}) + b"\n"
 
-            serializable_jobs.append(serializable_job)
-        
-        return {
-            "status": "success",
-            "job_card_count": len(serializable_jobs),
-            "execution_time": round(elapsed_time, 2),
-            "data": serializable_jobs
-        }
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Scraping failed: {str(e)}"
-        )
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
 
 
 if __name__ == "__main__":
@@ -1,709 +1,1406 @@
-import aiohttp
-import asyncio
-import json
-import re
-import time
-import random
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
-from pydantic import BaseModel, HttpUrl
-import uvicorn
-import os
-from datetime import datetime
-
-# Import selenium package
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-
-
-# Create the API APP
-app = FastAPI(
-    title="Seek Job Cards Scraper API",
-    description="A simple API to scrape job cards from Seek.com.au",
-    version="1.0.0"
-)
-
-# Define the data model for the job search
-class JobSearchRequest(BaseModel):
-    job_id: str
-
-class JobSearchResponseBatch(BaseModel):
-    job_ids: list[str]
-
-class WebhookJobSearchRequest(BaseModel):
-    job_ids: list[str]
-    webhook_url: str
-
-# Create class for all the functions regarding scraping
-class SeekJobCardsScraper:
-
-    def __init__(self, use_selenium=True):
-        """
-        Initialize the scraper with base URL and headers for requests
-
-        Args:
-            use_selenium: Boolean to determine to use selenium and not aiohttp
-        """
-        self.base_url = "https://www.seek.com.au"  # Define the main URL that will be used
-        self.use_selenium = use_selenium
-        self.timeout = 30  # Timeout in seconds for HTTP requests
-        
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15'
-        ]  # set the rotation of browsers
-        
-        if use_selenium:
-            self._setup_selenium()
-        else:
-            # Keep the aiohttp setup as backup
-            self.headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1'
-            }
-
-    def _setup_selenium(self):
-        """
-        Set up the Selenium web driver with Chrome
-        """
-        # Set up the Chrome options
-        chrome_options = Options()
-        
-        chrome_options.add_argument('--ignore-certificate-errors')
-        chrome_options.add_argument('--allow-insecure-localhost')
-        chrome_options.add_argument('--ignore-ssl-errors=yes')
-        chrome_options.add_argument('--disable-web-security')
-
-        # Add headless option for server environments
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-
-        # Add additional privacy options to avoid detection
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # Set user agent - Picks randomly from the list
-        chrome_options.add_argument(f"user-agent={random.choice(self.user_agents)}")
-    
-        ### chromedriver_path = '/usr/local/bin/chromedriver'
-        
-        chromedriver_path = '/usr/local/bin/chromedriver'
-        self.driver = webdriver.Chrome(
-             service=Service(chromedriver_path),  # change to chromedriver_path to use in sevalla -- ChromeDriverManager().install()
-             options=chrome_options
-         )
-
-         # Set window size
-        self.driver.set_window_size(1200, 720)
-        
-         # Execute JavaScript to mask WebDriver presence
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")   
-        
-
-    async def __aenter__(self):
-        """Set up resources when entering context"""
-        if not self.use_selenium:
-            # Only set up aiohttp if not using Selenium
-            self.session = aiohttp.ClientSession(headers=self.headers)
-            
-            # Make an initial request to get cookies
-            try:
-                async with self.session.get(self.base_url) as response:
-                    if response.status == 200:
-                        print("Successfully initialized session with cookies")
-            except Exception as e:
-                print(f"Error initializing session: {str(e)}")
-                
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up resources when exiting context"""
-        if self.use_selenium:
-            self.driver.quit()
-        else:
-            await self.session.close()
-
-    async def fetch_page(self, url: str, max_retries: int = 3) -> BeautifulSoup:
-        """
-        Fetch a webpage and return a BeautifulSoup object using either Selenium or aiohttp
-        """
-        if self.use_selenium:
-            return await self._fetch_with_selenium(url, max_retries)
-        else:
-            return await self._fetch_with_aiohttp(url, max_retries)
-
-    async def _fetch_with_selenium(self, url: str, max_retries: int = 3) -> BeautifulSoup:
-        """
-        Fetch a webpage using Selenium
-        """
-        for attempt in range(max_retries):
-            try:
-                # Execute in an asyncio executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                
-                # Load the page
-                await loop.run_in_executor(None, lambda: self.driver.get(url))
-                
-                # Add a random delay to simulate human behavior
-                await asyncio.sleep(random.uniform(2, 5))
-                
-                # Wait for the page content to load 
-                await loop.run_in_executor(
-                    None, 
-                    lambda: WebDriverWait(self.driver, self.timeout).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                )
-                
-                # Get page source
-                html = await loop.run_in_executor(None, lambda: self.driver.page_source)
-                
-                # Parse with BeautifulSoup
-                return BeautifulSoup(html, 'html.parser')
-                
-            except TimeoutException:
-                print(f"Timeout on attempt {attempt + 1} for {url}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                
-            except WebDriverException as e:
-                print(f"WebDriver error on attempt {attempt + 1} for {url}: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    
-                    # Refresh the WebDriver if we encounter issues
-                    if "ERR_INTERNET_DISCONNECTED" in str(e) or "invalid session id" in str(e):
-                        self.driver.quit()
-                        self._setup_selenium()
-                        
-            except Exception as e:
-                print(f"Unexpected error on attempt {attempt + 1} for {url}: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-        
-        print(f"Failed to fetch {url} after {max_retries} attempts")
-        return None    
-
-    async def _fetch_with_aiohttp(self, url: str, max_retries: int = 3) -> BeautifulSoup:
-        """
-        Fetch a webpage using aiohttp (kept as a fallback)
-        """
-        for attempt in range(max_retries):
-            try:
-                # Update headers with random user agent
-                self.session.headers.update({'User-Agent': random.choice(self.user_agents)})
-                
-                async with self.session.get(url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        return BeautifulSoup(html, 'html.parser')
-                    elif response.status == 403:
-                        print(f"Received 403 Forbidden. Waiting before retry.")
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        await asyncio.sleep(wait_time)
-                    else:
-                        print(f"Error fetching {url}: HTTP {response.status}")
-            except Exception as e:
-                print(f"Attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2)
-                else:
-                    print(f"Failed after {max_retries} attempts")
-                    raise
-        return None
-    
-    
-    
-    def sanitize_text(self, text):
-        """
-        Helps sanitize the text extracted from the website, avoiding Unicode errors.
-        """
-        if not isinstance(text, str):
-            return str(text)
-    
-        # Replace surrogate pairs and other problematic characters
-        try:
-            # First attempt: encode with surrogateescape and decode back
-            return text.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
-        except UnicodeError:
-            # Second attempt: more aggressive replacement
-            return text.encode('utf-8', 'replace').decode('utf-8')
-
-    def _convert_to_days(self, posted_time: str) -> float:
-        """
-        Convert posting time string to number of days
-        
-        Args:
-            posting_time: String representing when the job was posted (e.g., "Posted 2d ago")
-            
-        Returns:
-            Float representing the number of days
-        """
-        print(f"\nConverting posting time: {posted_time}")
-        
-        try:
-            if not posted_time or 'not found' in posted_time:
-                print("Invalid posting time, returning infinity")
-                return float('inf')
-            
-            # Remove "Posted" prefix and clean the string
-            cleaned_posted_time = posted_time.lower().replace('posted', '').strip()
-            print(f"Cleaned time string: {cleaned_posted_time}")
-
-            # Match a number followed by m (minutes), h (hours), or d (days)
-            match = re.match(r'(\d+)\s*([mhd])', cleaned_posted_time)
-            if not match:
-                print(f"Could not parse time format: {cleaned_posted_time}")
-                return float('inf')
-                        
-            value, unit = match.groups()
-            value = float(value)
-                    
-            # Convert to days based on unit
-            if unit == 'm':
-                days = value / (24 * 60)
-                print(f"Converting {value} minutes to {days:.2f} days")
-            elif unit == 'h':
-                days = value / 24
-                print(f"Converting {value} hours to {days:.2f} days")
-            else:  # unit == 'd'
-                days = value
-                print(f"Already in days: {days}")
-                        
-            return days
-                    
-        except Exception as e:
-            print(f"Error converting time: {str(e)}")
-            return float('inf')
-    
-    def extract_location(self, soup):
-        """
-        Extract job location from HTML using the job-detail-location container
-        and the anchor tag inside it.
-        
-        Args:
-            soup: BeautifulSoup object of the job page
-            
-        Returns:
-            str: The location text or "Location not found" if not found
-        """
-        # First try to find the container with data-automation="job-detail-location"
-        location_container = soup.select_one('[data-automation="job-detail-location"]')
-        
-        if location_container:
-            # Look for the anchor tag inside the container
-            location_link = location_container.select_one('a[class*="gepq850"]')
-            if location_link:
-                return self.sanitize_text(location_link.text.strip())
-            
-            # If no specific anchor found, try any anchor or the container text itself
-            location_link = location_container.select_one('a')
-            if location_link:
-                return self.sanitize_text(location_link.text.strip())
-                
-            return self.sanitize_text(location_container.text.strip())
-        
-        # Direct selector for the location anchor if container not found
-        location_link = soup.select_one('a[href*="/jobs/in-"][class*="gepq850"]')
-        if location_link:
-            return self.sanitize_text(location_link.text.strip())
-                
-        return "Location not found"
-
-                
-    #Extraction of the job details
-    async def extract_job_details(self, job_id: str) -> Dict: #once we have the job_url (defined later), the function will extract the details and added to a dictionary
-        """
-        Extract details from a single job posting.
-        
-        Args:
-            job_url: URL of the job posting
-            
-        Returns:
-            Dictionary containing job details (title, company, requirements, etc.)
-        """
-        #the dictionary will be called job_details
-        try:
-            
-            job_url = f"{self.base_url}/job/{job_id}"
-            
-            job_details = {
-                'url': job_url, 
-                'job_id': job_id
-            } #this first sentence will add the job_url to fetch de job page and the job id that is embeded in the url
-            
-            # Fetch and parse the job page
-            soup = await self.fetch_page(job_url) #this will parse the whole page and if its not a soup object, it will return None
-            if not soup:
-                return None
-                
-            # Extract job title
-            try:
-                title_element = soup.select_one('[data-automation="job-detail-title"], .j1ww7nx7')
-                job_details['job_title'] = self.sanitize_text(title_element.text.strip() if title_element else "Title not found")
-            except Exception as e:
-                job_details['job_title'] = "Title not found"
-
-            #Extract Location
-            try:
-                job_details['job_location'] = self.extract_location(soup)
-                print(f"Location: {job_details['job_location']}")
-            except Exception as e:
-                print(f"Error extracting location: {str(e)}")
-                job_details['job_location'] = "Location not found"
-            
-                
-            # Extract company name
-            try:
-                company_element = soup.select_one('[data-automation="advertiser-name"], .y735df0')
-                job_details['company'] = self.sanitize_text(company_element.text.strip() if company_element else "Company not found")
-            except Exception as e:
-                job_details['company'] = "Company not found"
-              
-                
-            # Extract job requirements/description
-            try:
-                description_element = soup.select_one('[data-automation="jobAdDetails"], .YCeva_0')
-                job_details['job_description'] = self.sanitize_text(description_element.text.strip() if description_element else "Description not found")
-            except Exception as e:
-                job_details['job_description'] = "Description not found"
-                
-            # Extract posting time
-            try:
-                # Look for spans containing "Posted" text
-                posting_elements = soup.select('[data-automation="jobDetailsPage"] span')
-                posting_time = "Posting time not found"
-                
-                for element in posting_elements: #for all the elements in the posting_comments vairable defined before, it will check if it has the posted word and any of the Time letters
-                    text = element.text.strip()
-                    if "Posted" in text and any(unit in text for unit in ["ago", "h", "d", "m"]): #if the posted element has it, it will return the extracted text
-                        posting_time = text
-                        break
-                         
-                job_details['posting_time'] = posting_time #Now it will be added to the dictionary
-            except Exception as e:
-                job_details['posting_time'] = "Posting time not found"
-
-
-            try: 
-                job_details['job_type'] = self.categorize_job_type(job_details['job_title'])
-                print(f"Job_type: {job_details['job_type']}")
-            except Exception as e:
-                job_details['job_type'] = "unknown"
-
-
-            try:
-                job_industry_element = soup.select_one('[data-automation="job-detail-classifications"], .j1ww7nx7')
-                job_details['job_industry'] = self.sanitize_text(job_industry_element.text.strip() if job_industry_element else "Industry not found")
-            except Exception as e:
-                job_details['job_industry'] = "Industry not found"
-
-            try:
-                job_work_type_element = soup.select_one('[data-automation="job-detail-work-type"], .j1ww7nx7')
-                job_details['job_work_type'] = self.sanitize_text(job_work_type_element.text.strip() if job_work_type_element else "Work type not found")
-            except Exception as e:
-                job_details['job_work_type'] = "Work type not found"
-
-            return job_details #returns the dictionary after finishing the extraction 
-
-        except Exception as e:
-            print(f"Error extracting job details: {str(e)}")
-            return {'url': f"{self.base_url}/job/{job_id}", 'job_id': job_id, 'error': str(e)}
-
-
-
-    
-    #Build a job_type categorization for the different job_types
-    def categorize_job_type(self, job_title: str) -> str:
-        """
-        Categorize job types based on the job title 
-
-        """
-        job_title_lower = job_title.lower()
-
-        #check for DA
-        if "data analyst" in job_title_lower:
-            return "Data Analyst"
-        
-        if "data engineer" in job_title_lower:
-            return "Data Engineer"
-        
-        if "business analyst" in job_title_lower:
-            return "Business Analyst"   
-        
-        if "analytics analyst" in job_title_lower:
-            return "Analytics Engineer"
-
-        if "data scientist" in job_title_lower:
-            return "Data Scientist" 
-        
-        if "report developer" in job_title_lower:
-            return "Report Developer" 
-        
-        if "solutions architect" in job_title_lower:
-            return "Solutions Architect" 
-
-        if "test analyst" in job_title_lower:
-            return "Test Analyst"
-
-        if "head of marketing" in job_title_lower:
-            return "Head of Marketing"
-
-        if "product marketer" in job_title_lower:
-            return "Product Marketer"
-
-        if "growth marketer" in job_title_lower:
-            return "Growth Marketer"
-
-        if "growth manager" in job_title_lower:
-            return "Growth Manager"
-
-        if "social media manager" in job_title_lower:
-            return "Social Media Manager"
-        
-        if "software developer" in job_title_lower:
-            return "Software Developer"
-        
-        if "software engineer" in job_title_lower:
-            return "Software Engineer"
-        
-        if "ux designer" in job_title_lower:
-            return "UX Designer"
-
-        if "content marketer" in job_title_lower:
-            return "Content Marketer"
-
-        if "digital marketer" in job_title_lower:
-            return "Digital Marketer"
-
-        if "graphic designer" in job_title_lower:
-            return "Graphic Designer"
-
-        if "community manager" in job_title_lower:
-            return "Community Manager"
-
-        if "seo specialist" in job_title_lower:
-            return "SEO Specialist"
-
-        if "marketing manager" in job_title_lower:
-            return "Marketing Manager"
-
-        if "marketing coordinator" in job_title_lower:
-            return "Marketing Coordinator"
-
-        if "marketing specialist" in job_title_lower:
-            return "Marketing Specialist"
-
-        if "marketing assistant" in job_title_lower:
-            return "Marketing Assistant"
-
-        if "marketing executive" in job_title_lower:
-            return "Marketing Executive"
-        
-        if "marketing analyst" in job_title_lower:
-            return "Marketing Analyst"
-        
-        return "unknown"
-
-   
-
-
-# Creates a directory to save the results if it doesnt exists
-RESULTS_DIR = "results"
-os.makedirs(RESULTS_DIR, exist_ok=True)
-
-
-async def send_to_webhook(url: str, data: dict) -> dict:
-        """
-        Sends JSON data to a specified webhook URL using POST.
-
-        Args:
-            url (str): Webhook URL to send the data to.
-            data (dict): JSON-serializable data to send.
-
-        Returns:
-            dict: Response status and message.
-        """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data) as response:
-                    response_text = await response.text()
-                    return {
-                        "status": "sent",
-                        "webhook_status": response.status,
-                        "webhook_response": response_text
-                    }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e)
-            }
-
-async def background_scrape_and_send(job_ids: List[str], webhook_url: str):
-    async with SeekJobCardsScraper(use_selenium=True) as scraper:
-        all_jobs_data = []
-        for job_id in job_ids:
-            job_data = await scraper.extract_job_details(str(job_id))
-            if job_data:
-                serializable_job = {}
-                for key, value in job_data.items():
-                    if isinstance(value, str):
-                        serializable_job[key] = scraper.sanitize_text(value)
-                    elif isinstance(value, (type, object)) and not isinstance(value, (int, float, bool, str, list, dict, type(None))):
-                        serializable_job[key] = str(value)
-                    else:
-                        serializable_job[key] = value
-                all_jobs_data.append(serializable_job)
-        
-        webhook_payload = {
-            "status": "success",
-            "job_count": len(all_jobs_data),
-            "data": all_jobs_data,
-            # You can add a timestamp here instead of elapsed time
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        await send_to_webhook(webhook_url, webhook_payload)
-
-
-# Define the API endpoints
-
-@app.get("/")
-async def root():
-    """Root endpoint that returns basic API information"""
-    return {
-        "message": "Welcome to the Seek Job Cards Scraper API",
-        "version": "1.0.0",
-        "endpoints": {
-            "/scrape": "POST - Scrape job cards based on search criteria and return results",
-            "/health": "GET - Check API health status"
-        }
-    }
-
-@app.get("/health_jc")
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
-
-# Scrape endpoint
-@app.post("/scrape_jc")
-async def scrape_job_cards_endpoint(request: JobSearchRequest):
-    """
-    Endpoint to scrape job details based on a list of job IDs
-    
-    Returns the scraped job details directly in the response
-    """
-    try:
-        start_time = time.time()
-        all_jobs_data = [] # Initialize a list to hold all scraped job data
-
-        # Run the scraper
-        async with SeekJobCardsScraper(use_selenium=True) as scraper:
-            # Iterate over each job_id in the request
-            for job_id in request.job_ids:
-                job_data = await scraper.extract_job_details(str(job_id))
-                if job_data: # Only add if job_data is not None
-                    # Ensure all values are properly serializable for each job
-                    serializable_job = {}
-                    for key, value in job_data.items():
-                        if isinstance(value, str):
-                            serializable_job[key] = scraper.sanitize_text(value)
-                        elif isinstance(value, (type, object)) and not isinstance(value, (int, float, bool, str, list, dict, type(None))):
-                            serializable_job[key] = str(value)
-                        else:
-                            serializable_job[key] = value
-                    all_jobs_data.append(serializable_job)
-
-        elapsed_time = time.time() - start_time
-        
-        return {
-            "status": "success",
-            "job_count": len(all_jobs_data),
-            "data": all_jobs_data,
-            "elapsed_time": f"{elapsed_time:.2f} seconds"
-        }
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Scraping failed: {str(e)}"
-        )
-    
-@app.post("/scrape_batch_jc")
-async def scrape_job_cards_batch_endpoint(
-    request: JobSearchResponseBatch):
-
-    try:
-        start_time = time.time()
-        all_jobs_data = []  # Initialize a list to hold all scraped job data
-
-        async with SeekJobCardsScraper(use_selenium=True) as scraper:
-            # Iterate over each job_id in the request
-            for job_id in request.job_ids:
-                job_data = await scraper.extract_job_details(str(job_id))
-                if job_data:
-                    serializable_job = {}
-                    for key, value in job_data.items():
-                        if isinstance(value, str):
-                            serializable_job[key] = scraper.sanitize_text(value)
-                        elif isinstance(value, (type, object)) and not isinstance(value, (int, float, bool, str, list, dict, type(None))):
-                            serializable_job[key] = str(value)
-                        else:
-                            serializable_job[key] = value
-                    all_jobs_data.append(serializable_job)
-        elapsed_time = time.time() - start_time
-
-        return {
-            "status": "success",
-            "job_count": len(all_jobs_data),
-            "data": all_jobs_data,
-            "elapsed_time": f"{elapsed_time:.2f} seconds"
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Scraping failed: {str(e)}"
-        )   
-
-@app.post("/scrape_webhook_jc")
-async def scrape_and_send_to_webhook(
-    request: WebhookJobSearchRequest,
-    background_tasks: BackgroundTasks
-):
-    background_tasks.add_task(background_scrape_and_send, request.job_ids, str(request.webhook_url))
-    return {
-        "status": "accepted",
-        "message": "Scraping started and webhook will be called asynchronously"
-    }
-    
-
-if __name__ == "__main__":
-    # Determine port - use environment variable if available
-    port = int(os.environ.get("PORT", 8080))
-    
-    # Run the API server
-    uvicorn.run("seek_job_cards_scraper:app", host="0.0.0.0", port=port, reload=False)
-
-# Run server manually
+import aiohttp
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import gzip
+import json
+import logging
+import orjson
+import re
+import time
+import random
+from typing import List, Dict, Optional
+from bs4 import BeautifulSoup
+import soupsieve as sv
+from cachetools import TTLCache
+from urllib.parse import urljoin
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, HttpUrl
+import uvicorn
+import os
+import weakref
+from datetime import datetime, timezone
+
+# Import selenium package
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Swap the pure-Python event loop for uvloop when available (it is pinned in
+# requirements.txt, but e.g. Windows dev boxes don't have it)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+# Default to INFO so the per-job DEBUG chatter is short-circuited before any
+# string formatting happens; override with LOG_LEVEL=DEBUG when digging
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'))
+logger = logging.getLogger(__name__)
+
+
+# Create the API APP
+app = FastAPI(
+    title="Seek Job Cards Scraper API",
+    description="A simple API to scrape job cards from Seek.com.au",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
+
+# Define the data model for the job search
+class JobSearchRequest(BaseModel):
+    job_id: str
+
+class JobSearchResponseBatch(BaseModel):
+    job_ids: list[str]
+
+class WebhookJobSearchRequest(BaseModel):
+    job_ids: list[str]
+    webhook_url: str
+
+# Process-wide cache of scraped job details keyed by job_id. Repeat IDs within
+# the TTL are served straight from memory instead of re-fetching the page.
+_JOB_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+
+# Per-job_id locks so concurrent requests for the same id coalesce into one
+# scrape. Weak values mean a lock disappears once no task holds it.
+_JOB_LOCKS = weakref.WeakValueDictionary()
+
+
+def _job_lock(job_id: str) -> asyncio.Lock:
+    """Return the shared lock for a job_id, creating it on first use"""
+    lock = _JOB_LOCKS.get(job_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _JOB_LOCKS[job_id] = lock
+    return lock
+
+
+# Compiled once at import instead of on every _convert_to_days call
+_POSTED_RE = re.compile(r'(\d+)\s*([mhd])')
+
+# Strips the leading "Posted" in one pass instead of lower+replace+strip
+_POSTED_PREFIX_RE = re.compile(r'^\s*posted\s*', re.IGNORECASE)
+
+# Matches a span that carries "Posted" plus a time unit, replacing the
+# per-span "in" checks of the posting-time scan
+_POSTED_SPAN_RE = re.compile(r'(?s)(?=.*Posted)(?=.*(?:ago|[hdm]))')
+
+# CSS selectors compiled once at import - soupsieve otherwise re-tokenizes
+# the selector string (through a small cache) on every select call. These are
+# the fallbacks that still run when the data-automation walk comes up empty.
+_SEL = {
+    'class_title': sv.compile('.j1ww7nx7'),
+    'class_company': sv.compile('.y735df0'),
+    'class_description': sv.compile('.YCeva_0'),
+    'location_container': sv.compile('[data-automation="job-detail-location"]'),
+    'location_anchor': sv.compile('a[class*="gepq850"]'),
+    'anchor': sv.compile('a'),
+    'location_direct': sv.compile('a[href*="/jobs/in-"][class*="gepq850"]'),
+    'page_spans': sv.compile('[data-automation="jobDetailsPage"] span'),
+}
+
+# Cap on concurrent Seek page fetches across every request this process is
+# serving - the connector limits cap sockets, this caps in-flight requests so
+# big parallel batches don't trip the rate limiter into 403s
+_SEEK_SEM = asyncio.Semaphore(8)
+
+# Minimal query for Seek's GraphQL jobDetails operation - the same backend
+# the job pages themselves render from. Kept to the fields we map, so schema
+# drift in parts we don't read can't break the request.
+_JOB_DETAILS_QUERY = """
+query jobDetails($jobId: ID!) {
+  jobDetails(id: $jobId) {
+    job {
+      title
+      advertiser { name }
+      location { label }
+      listedAt { label }
+      classifications { label }
+      workTypes { label }
+      content
+      abstract
+    }
+  }
+}
+"""
+
+# Shared across all scraper instances - set the rotation of browsers
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15'
+)
+
+
+_CHROMEDRIVER_PATH = '/usr/local/bin/chromedriver'  # change to ChromeDriverManager().install() outside sevalla
+
+# One long-lived chromedriver process shared by every browser session -
+# spawning a fresh chromedriver per driver costs several hundred ms each
+_SERVICE = Service(_CHROMEDRIVER_PATH)
+
+
+def _ensure_service():
+    """Start the shared chromedriver service on first use"""
+    if not _SERVICE.is_connectable():
+        _SERVICE.start()
+        atexit.register(_SERVICE.stop)
+
+
+def _create_chrome_driver():
+    """
+    Create a headless Chrome driver with the anti-detection options
+
+    Attaches a Remote session to the shared chromedriver service instead of
+    spawning a new chromedriver process per driver.
+
+    Returns:
+        A ready-to-use selenium Chrome driver
+    """
+    # Set up the Chrome options
+    chrome_options = Options()
+
+    # Return control once the DOM is interactive instead of waiting for
+    # onload - the WebDriverWait on the job title gates on real content
+    chrome_options.page_load_strategy = 'eager'
+
+    chrome_options.add_argument('--ignore-certificate-errors')
+    chrome_options.add_argument('--allow-insecure-localhost')
+    chrome_options.add_argument('--ignore-ssl-errors=yes')
+    chrome_options.add_argument('--disable-web-security')
+
+    # Add headless option for server environments
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+
+    # Turn off renderer subsystems job pages don't need - each one costs
+    # CPU, memory and background network per pooled driver
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-features=TranslateUI,MediaRouter,OptimizationHints")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--mute-audio")
+
+    # Add additional privacy options to avoid detection
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+
+    # Set user agent - Picks randomly from the list
+    chrome_options.add_argument(f"user-agent={random.choice(_USER_AGENTS)}")
+
+    # Skip images, stylesheets and fonts - the job details live in the HTML,
+    # so these assets are bandwidth and render time for nothing
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+    _ensure_service()
+    driver = webdriver.Remote(
+        command_executor=_SERVICE.service_url,
+        options=chrome_options
+    )
+
+    # Remote sessions don't expose execute_cdp_cmd, so register the
+    # chromedriver vendor endpoint for the network-blocking calls below
+    driver.command_executor._commands["executeCdpCommand"] = (
+        "POST", "/session/$sessionId/goog/cdp/execute")
+
+    # Set window size
+    driver.set_window_size(1200, 720)
+
+    # Execute JavaScript to mask WebDriver presence
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    # Block asset and tracker requests at the network layer as well
+    try:
+        driver.execute("executeCdpCommand", {"cmd": "Network.enable", "params": {}})
+        driver.execute("executeCdpCommand", {"cmd": "Network.setBlockedURLs", "params": {
+            "urls": ["*.png", "*.jpg", "*.woff*", "*google-analytics*", "*doubleclick*"]
+        }})
+    except Exception as e:
+        logger.warning("Could not set CDP network blocks: %s", e)
+
+    return driver
+
+
+class SeleniumDriverPool:
+    """
+    Pool of reusable headless Chrome drivers shared across API requests
+
+    Spawning Chrome costs seconds per request, so drivers are created lazily
+    up to the pool size and then recycled instead of being quit after every
+    scrape.
+    """
+
+    def __init__(self, size: int = None):
+        self.size = size or int(os.environ.get("SELENIUM_POOL_SIZE", 4))
+        self._queue = asyncio.Queue()
+        self._created = 0
+        self._lock = asyncio.Lock()
+        self._drivers = []
+
+    async def acquire(self):
+        """Check out a driver, creating one if the pool is not full yet"""
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+
+        async with self._lock:
+            if self._created < self.size:
+                loop = asyncio.get_event_loop()
+                driver = await loop.run_in_executor(None, _create_chrome_driver)
+                self._created += 1
+                self._drivers.append(driver)
+                return driver
+
+        return await self._queue.get()
+
+    async def release(self, driver):
+        """
+        Return a driver to the pool after clearing per-scrape state
+
+        The reset is two blocking WebDriver round trips, so it runs on the
+        selenium executor instead of the event loop.
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(_SELENIUM_EXECUTOR, self._reset, driver)
+        except Exception as e:
+            logger.warning("Error resetting pooled driver, discarding it: %s", e)
+            await self.discard(driver)
+            return
+        self._queue.put_nowait(driver)
+
+    @staticmethod
+    def _reset(driver):
+        """Clear per-scrape browser state (runs on the selenium executor)"""
+        driver.delete_all_cookies()
+        driver.execute_script('window.stop()')
+
+    async def discard(self, driver):
+        """Quit a broken driver and free its slot so a new one can be created"""
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(_SELENIUM_EXECUTOR, driver.quit)
+        except Exception:
+            pass
+        if driver in self._drivers:
+            self._drivers.remove(driver)
+        self._created = max(0, self._created - 1)
+
+    async def prewarm(self):
+        """Fill the pool up front so the first scrapes skip Chrome startup"""
+        loop = asyncio.get_event_loop()
+        async with self._lock:
+            while self._created < self.size:
+                driver = await loop.run_in_executor(None, _create_chrome_driver)
+                self._created += 1
+                self._drivers.append(driver)
+                self._queue.put_nowait(driver)
+
+    def shutdown(self):
+        """Quit every pooled driver (called at app shutdown)"""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers.clear()
+        self._created = 0
+
+
+# One pool shared by every request handled by this process
+DRIVER_POOL = SeleniumDriverPool()
+
+# One in-page JS call returns every field the selenium path needs, replacing
+# a full page_source round-trip plus a BeautifulSoup parse with five
+# querySelector lookups executed inside the browser
+_SELENIUM_EXTRACT_JS = """
+const get = (sel) => {
+    const el = document.querySelector(sel);
+    return el ? el.innerText : null;
+};
+let posting = null;
+const page = document.querySelector('[data-automation="jobDetailsPage"]');
+if (page) {
+    for (const span of page.querySelectorAll('span')) {
+        const text = span.innerText;
+        if (text && text.includes('Posted') && /ago|[mhd]/.test(text)) {
+            posting = text.trim();
+            break;
+        }
+    }
+}
+return {
+    job_title: get('[data-automation="job-detail-title"]'),
+    job_location: get('[data-automation="job-detail-location"]'),
+    company: get('[data-automation="advertiser-name"]'),
+    job_description: get('[data-automation="jobAdDetails"]'),
+    job_industry: get('[data-automation="job-detail-classifications"]'),
+    job_work_type: get('[data-automation="job-detail-work-type"]'),
+    posting_time: posting
+};
+"""
+
+def _sync_fetch(driver, url: str, timeout: int, humanize: bool = False) -> str:
+    """
+    Blocking page load executed on the selenium executor
+
+    Bundles get + wait + page_source into one executor submission so each
+    page fetch crosses the thread boundary once instead of three times.
+    """
+    driver.get(url)
+    if humanize:
+        # Random delay to simulate human behavior
+        time.sleep(random.uniform(2, 5))
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located(
+            (By.CSS_SELECTOR, '[data-automation="job-detail-title"]')
+        )
+    )
+    return driver.page_source
+
+
+def _sync_extract(driver, url: str, timeout: int, humanize: bool = False):
+    """Blocking load plus in-page JS extraction in one executor submission"""
+    driver.get(url)
+    if humanize:
+        # Random delay to simulate human behavior
+        time.sleep(random.uniform(2, 5))
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located(
+            (By.CSS_SELECTOR, '[data-automation="job-detail-title"]')
+        )
+    )
+    return driver.execute_script(_SELENIUM_EXTRACT_JS)
+
+
+# Blocking driver calls get their own executor (one thread per pooled driver)
+# so they don't starve the asyncio default thread pool
+_SELENIUM_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=DRIVER_POOL.size, thread_name_prefix='selenium')
+
+# Bound concurrent selenium fetches to the number of pooled drivers
+_SELENIUM_SEM = asyncio.Semaphore(DRIVER_POOL.size)
+
+
+# Create class for all the functions regarding scraping
+class SeekJobCardsScraper:
+
+    # Title substrings and the category each one maps to. Matched in a single
+    # pass by _JOB_TYPE_RE below instead of one sequential scan per category.
+    _JOB_TYPE_PATTERNS = [
+        ("data analyst", "Data Analyst"),
+        ("data engineer", "Data Engineer"),
+        ("business analyst", "Business Analyst"),
+        ("analytics analyst", "Analytics Engineer"),
+        ("data scientist", "Data Scientist"),
+        ("report developer", "Report Developer"),
+        ("solutions architect", "Solutions Architect"),
+        ("test analyst", "Test Analyst"),
+        ("head of marketing", "Head of Marketing"),
+        ("product marketer", "Product Marketer"),
+        ("growth marketer", "Growth Marketer"),
+        ("growth manager", "Growth Manager"),
+        ("social media manager", "Social Media Manager"),
+        ("software developer", "Software Developer"),
+        ("software engineer", "Software Engineer"),
+        ("ux designer", "UX Designer"),
+        ("content marketer", "Content Marketer"),
+        ("digital marketer", "Digital Marketer"),
+        ("graphic designer", "Graphic Designer"),
+        ("community manager", "Community Manager"),
+        ("seo specialist", "SEO Specialist"),
+        ("marketing manager", "Marketing Manager"),
+        ("marketing coordinator", "Marketing Coordinator"),
+        ("marketing specialist", "Marketing Specialist"),
+        ("marketing assistant", "Marketing Assistant"),
+        ("marketing executive", "Marketing Executive"),
+        ("marketing analyst", "Marketing Analyst"),
+    ]
+    _JOB_TYPE_RE = re.compile(
+        "|".join(
+            f"(?P<c{index}>{re.escape(pattern)})"
+            for index, (pattern, _) in enumerate(_JOB_TYPE_PATTERNS)
+        ),
+        re.IGNORECASE,
+    )
+    _JOB_TYPE_LABELS = {
+        f"c{index}": category
+        for index, (_, category) in enumerate(_JOB_TYPE_PATTERNS)
+    }
+
+    # data-automation values the HTML fallback needs, collected in a single
+    # pass over the tree instead of one full-tree selector match per field
+    _DETAIL_TARGETS = frozenset({
+        "job-detail-title",
+        "advertiser-name",
+        "jobAdDetails",
+        "job-detail-location",
+        "job-detail-classifications",
+        "job-detail-work-type",
+        "jobDetailsPage",
+    })
+
+    def __init__(self, use_selenium=False, session=None):
+        """
+        Initialize the scraper with base URL and headers for requests
+
+        Args:
+            use_selenium: Boolean to force selenium instead of aiohttp. Seek's
+                /job/ pages are server-rendered, so aiohttp is the default and
+                selenium stays as an opt-in fallback for anti-bot cases.
+            session: Optional shared aiohttp.ClientSession. When provided the
+                scraper reuses it (keep-alive and TLS reuse across requests)
+                and does not close it on exit.
+        """
+        self.base_url = "https://www.seek.com.au"  # Define the main URL that will be used
+        self.use_selenium = use_selenium
+        self.timeout = 30  # Timeout in seconds for HTTP requests
+        self.session = session
+        self._owns_session = session is None
+        # Opt-in human-behavior jitter for the selenium paths. The old
+        # unconditional 2-5s sleep put a hard floor on every page load; with
+        # UA rotation and the anti-detection options it is rarely needed.
+        self.humanize = bool(int(os.environ.get('SCRAPER_HUMANIZE', '0')))
+
+        self.user_agents = _USER_AGENTS
+
+        if use_selenium:
+            # Drivers are checked out of the shared pool per page fetch, so
+            # gathered jobs can run against distinct browsers in parallel
+            pass
+        else:
+            # Headers for the aiohttp session (the default path)
+            self.headers = {
+                'User-Agent': random.choice(self.user_agents),
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'Sec-Fetch-Dest': 'document',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-Site': 'none',
+                'Sec-Fetch-User': '?1'
+            }
+
+    async def __aenter__(self):
+        """Set up resources when entering context"""
+        if not self.use_selenium and self.session is None:
+            # No shared session injected - open a private one with explicit
+            # connection limits so concurrent fetches reuse keep-alive
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+            # Split budgets: 5 s to connect and 15 s per socket read keep a
+            # stalled DNS lookup or body from eating the whole total window
+            self._timeout = aiohttp.ClientTimeout(
+                total=self.timeout, connect=5, sock_read=15)
+            self.session = aiohttp.ClientSession(
+                headers=self.headers, connector=connector,
+                timeout=self._timeout, trust_env=True)
+
+            # Make an initial request to get cookies
+            try:
+                async with self.session.get(self.base_url) as response:
+                    if response.status == 200:
+                        logger.debug("Successfully initialized session with cookies")
+            except Exception as e:
+                logger.warning("Error initializing session: %s", e)
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Clean up resources when exiting context"""
+        if not self.use_selenium and self._owns_session and self.session is not None:
+            # Shared sessions are closed by the app shutdown hook, not here
+            await self.session.close()
+
+    async def fetch_page(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+        """
+        Fetch a webpage and return a BeautifulSoup object using either Selenium or aiohttp
+        """
+        if self.use_selenium:
+            return await self._fetch_with_selenium(url, max_retries)
+        else:
+            return await self._fetch_with_aiohttp(url, max_retries)
+
+    async def _fetch_with_selenium(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+        """
+        Fetch a webpage using Selenium
+
+        Checks a driver out of the shared pool for the duration of one page
+        load, so gathered extract_job_details tasks run against distinct
+        browsers in parallel instead of queueing behind a single one.
+        """
+        async with _SELENIUM_SEM:
+            driver = await DRIVER_POOL.acquire()
+            try:
+                for attempt in range(max_retries):
+                    try:
+                        # Execute in the dedicated selenium executor to avoid
+                        # blocking the event loop or the default thread pool
+                        loop = asyncio.get_event_loop()
+
+                        # Load + wait + read the page source in one executor
+                        # hop instead of three
+                        html = await loop.run_in_executor(
+                            _SELENIUM_EXECUTOR, _sync_fetch, driver, url,
+                            self.timeout, self.humanize)
+
+                        # Parse with BeautifulSoup on the C-backed lxml parser,
+                        # in a worker thread so the event loop stays free
+                        return await loop.run_in_executor(None, BeautifulSoup, html, 'lxml')
+
+                    except TimeoutException:
+                        logger.warning("Timeout on attempt %d for %s", attempt + 1, url)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
+                    except WebDriverException as e:
+                        logger.warning("WebDriver error on attempt %d for %s: %s", attempt + 1, url, e)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(2 ** attempt)
+
+                            # Swap in a fresh pooled driver if this one broke
+                            if "ERR_INTERNET_DISCONNECTED" in str(e) or "invalid session id" in str(e):
+                                await DRIVER_POOL.discard(driver)
+                                driver = await DRIVER_POOL.acquire()
+
+                    except Exception as e:
+                        logger.warning("Unexpected error on attempt %d for %s: %s", attempt + 1, url, e)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(2 ** attempt)
+
+                logger.error("Failed to fetch %s after %d attempts", url, max_retries)
+                return None
+            finally:
+                await DRIVER_POOL.release(driver)
+
+    async def _extract_with_selenium_js(self, job_url: str) -> Optional[Dict]:
+        """
+        Load a job page and pull the detail fields with one in-page JS call
+
+        driver.page_source serializes the whole document over the WebDriver
+        protocol and then BeautifulSoup re-parses it just to read a handful
+        of fields; a single execute_script returns them directly.
+
+        Args:
+            job_url: URL of the job posting
+
+        Returns:
+            Dict of raw field strings (values may be None), or None on failure
+        """
+        async with _SELENIUM_SEM:
+            driver = await DRIVER_POOL.acquire()
+            try:
+                loop = asyncio.get_event_loop()
+                # Load + wait + extract in one executor hop instead of three
+                return await loop.run_in_executor(
+                    _SELENIUM_EXECUTOR, _sync_extract, driver, job_url,
+                    self.timeout, self.humanize)
+            except (TimeoutException, WebDriverException) as e:
+                logger.warning("JS extraction failed for %s: %s", job_url, e)
+                if "ERR_INTERNET_DISCONNECTED" in str(e) or "invalid session id" in str(e):
+                    await DRIVER_POOL.discard(driver)
+                    driver = await DRIVER_POOL.acquire()
+                return None
+            finally:
+                await DRIVER_POOL.release(driver)
+
+    async def _fetch_with_aiohttp(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+        """
+        Fetch a webpage using aiohttp (the default path)
+
+        Seek's /job/ pages are server-rendered, so plain HTTP gets the full
+        document without browser startup or render time. If the response
+        doesn't contain the job detail markers (a JS challenge page instead),
+        the fetch falls back to selenium.
+        """
+        # Full browser-like header set plus one user agent per request,
+        # passed as a per-call override; the shared session carries no
+        # default headers and its dict must not be mutated mid-flight
+        headers = {**self.headers, 'User-Agent': random.choice(self.user_agents)}
+        for attempt in range(max_retries):
+            try:
+                # Hold the semaphore only for the request itself, not the
+                # backoff sleeps or the selenium fallback
+                html = None
+                async with _SEEK_SEM:
+                    async with self.session.get(url, headers=headers) as response:
+                        status = response.status
+                        if status == 200:
+                            html = await response.text()
+
+                if status == 200:
+                    # A real job page carries the detail marker or the
+                    # Next.js payload; anything else is a challenge page
+                    if 'job-detail-title' not in html and '__NEXT_DATA__' not in html:
+                        logger.warning("No job detail markers in %s, falling back to selenium", url)
+                        return await self._fetch_with_selenium(url, max_retries)
+                    # Parsing a Seek-sized page is pure CPU work, so run
+                    # it in a worker thread instead of on the event loop
+                    loop = asyncio.get_event_loop()
+                    return await loop.run_in_executor(None, BeautifulSoup, html, 'lxml')
+                elif status == 403:
+                    logger.warning("Received 403 Forbidden. Waiting before retry.")
+                    wait_time = 2 ** attempt  # Exponential backoff
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.warning("Error fetching %s: HTTP %d", url, status)
+            except Exception as e:
+                logger.warning("Attempt %d failed: %s", attempt + 1, e)
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2)
+                else:
+                    logger.error("Failed after %d attempts", max_retries)
+                    raise
+        return None
+    
+    
+    
+    @staticmethod
+    def sanitize_text(text):
+        """
+        Helps sanitize the text extracted from the website, avoiding Unicode errors.
+        """
+        if not isinstance(text, str):
+            return str(text)
+
+        # Pure-ASCII text can't hold surrogates, so skip the roundtrip
+        if text.isascii():
+            return text
+
+        # Replace surrogate pairs and other problematic characters
+        try:
+            # First attempt: encode with surrogateescape and decode back
+            return text.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+        except UnicodeError:
+            # Second attempt: more aggressive replacement
+            return text.encode('utf-8', 'replace').decode('utf-8')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _convert_to_days(posted_time: str) -> float:
+        """
+        Convert posting time string to number of days
+
+        Pure on its string argument and the same strings repeat constantly
+        within a batch ("Posted 2d ago", ...), so results are memoized.
+
+        Args:
+            posting_time: String representing when the job was posted (e.g., "Posted 2d ago")
+
+        Returns:
+            Float representing the number of days
+        """
+        logger.debug("Converting posting time: %s", posted_time)
+        
+        try:
+            if not posted_time or 'not found' in posted_time:
+                logger.debug("Invalid posting time, returning infinity")
+                return float('inf')
+            
+            # Remove "Posted" prefix and clean the string in one regex pass
+            cleaned_posted_time = _POSTED_PREFIX_RE.sub('', posted_time).strip().lower()
+            logger.debug("Cleaned time string: %s", cleaned_posted_time)
+
+            # Match a number followed by m (minutes), h (hours), or d (days)
+            match = _POSTED_RE.match(cleaned_posted_time)
+            if not match:
+                logger.debug("Could not parse time format: %s", cleaned_posted_time)
+                return float('inf')
+                        
+            value, unit = match.groups()
+            value = float(value)
+                    
+            # Convert to days based on unit
+            if unit == 'm':
+                days = value / (24 * 60)
+                logger.debug("Converting %s minutes to %.2f days", value, days)
+            elif unit == 'h':
+                days = value / 24
+                logger.debug("Converting %s hours to %.2f days", value, days)
+            else:  # unit == 'd'
+                days = value
+                logger.debug("Already in days: %s", days)
+                        
+            return days
+                    
+        except Exception as e:
+            logger.warning("Error converting time: %s", e)
+            return float('inf')
+    
+    def _job_from_next_data(self, soup):
+        """
+        Pull the job record out of Seek's embedded Next.js payload.
+
+        Job pages ship a <script id="__NEXT_DATA__"> blob containing the full
+        job record, so one json.loads replaces the per-field CSS traversal.
+
+        Args:
+            soup: BeautifulSoup object of the job page
+
+        Returns:
+            dict with the job record, or None when the payload is missing
+        """
+        script = soup.find('script', id='__NEXT_DATA__')
+        if script is None or not script.string:
+            return None
+        try:
+            data = json.loads(script.string)
+            return data['props']['pageProps']['jobDetails']['job']
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    async def _fetch_via_api(self, job_id: str) -> Optional[Dict]:
+        """
+        Try Seek's GraphQL backend for the job record before loading the page
+
+        The HTML page is just a render of this API, so a direct hit returns
+        the same fields in a fraction of the bytes with no parse at all.
+        Strictly best-effort: any non-200, schema mismatch or challenge
+        returns None and the caller falls back to the page scrape.
+
+        Args:
+            job_id: Seek job ID
+
+        Returns:
+            The job record dict, or None when the API can't be used
+        """
+        payload = {
+            'operationName': 'jobDetails',
+            'variables': {'jobId': str(job_id)},
+            'query': _JOB_DETAILS_QUERY
+        }
+        # Same browser-like header set as the page fetches - the shared
+        # session has no defaults, and a python/aiohttp User-Agent here
+        # would get the fast path rejected before it ever paid off
+        headers = {
+            **self.headers,
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'application/json'
+        }
+        try:
+            async with _SEEK_SEM:
+                async with self.session.post(
+                    f"{self.base_url}/graphql",
+                    json=payload,
+                    headers=headers
+                ) as response:
+                    if response.status != 200:
+                        return None
+                    data = await response.json(content_type=None)
+            if not isinstance(data, dict) or data.get('errors'):
+                return None
+            return ((data.get('data') or {}).get('jobDetails') or {}).get('job') or None
+        except Exception as e:
+            logger.debug("GraphQL jobDetails fetch failed for %s: %s", job_id, e)
+            return None
+
+    def _map_job_record(self, job: Dict, job_details: Dict) -> Dict:
+        """
+        Fill job_details from a structured Seek job record
+
+        The record shape is shared between the embedded __NEXT_DATA__
+        payload and the GraphQL jobDetails response, so both fast paths
+        feed through here.
+
+        Args:
+            job: The job record dict
+            job_details: Partially-filled details dict (url, job_id)
+
+        Returns:
+            The completed job_details dict
+        """
+        job_details['job_title'] = self.sanitize_text(job.get('title') or "Title not found")
+
+        location = (job.get('location') or {}).get('label')
+        job_details['job_location'] = self.sanitize_text(location) if location else "Location not found"
+
+        advertiser = (job.get('advertiser') or {}).get('name')
+        job_details['company'] = self.sanitize_text(advertiser) if advertiser else "Company not found"
+
+        content = job.get('content') or job.get('abstract')
+        if content:
+            # content is an HTML fragment, so strip the tags out
+            job_details['job_description'] = self.sanitize_text(
+                BeautifulSoup(content, 'lxml').get_text(separator=' ', strip=True)
+            )
+        else:
+            job_details['job_description'] = "Description not found"
+
+        listed = (job.get('listedAt') or {}).get('label')
+        job_details['posting_time'] = self.sanitize_text(listed) if listed else "Posting time not found"
+
+        job_details['job_type'] = self.categorize_job_type(job_details['job_title'])
+
+        classifications = [
+            c.get('label') for c in (job.get('classifications') or [])
+            if isinstance(c, dict) and c.get('label')
+        ]
+        job_details['job_industry'] = self.sanitize_text(', '.join(classifications)) if classifications else "Industry not found"
+
+        work_type = (job.get('workTypes') or {}).get('label')
+        job_details['job_work_type'] = self.sanitize_text(work_type) if work_type else "Work type not found"
+
+        return job_details
+
+    def extract_location(self, soup, container=None):
+        """
+        Extract job location from HTML using the job-detail-location container
+        and the anchor tag inside it.
+
+        Args:
+            soup: BeautifulSoup object of the job page
+            container: The job-detail-location element when the caller already
+                collected it, saving the full-tree lookup
+
+        Returns:
+            str: The location text or "Location not found" if not found
+        """
+        # First try to find the container with data-automation="job-detail-location"
+        location_container = container if container is not None else \
+            _SEL['location_container'].select_one(soup)
+
+        if location_container:
+            # Look for the anchor tag inside the container
+            location_link = _SEL['location_anchor'].select_one(location_container)
+            if location_link:
+                return self.sanitize_text(location_link.text.strip())
+            
+            # If no specific anchor found, try any anchor or the container text itself
+            location_link = _SEL['anchor'].select_one(location_container)
+            if location_link:
+                return self.sanitize_text(location_link.text.strip())
+                
+            return self.sanitize_text(location_container.text.strip())
+        
+        # Direct selector for the location anchor if container not found
+        location_link = _SEL['location_direct'].select_one(soup)
+        if location_link:
+            return self.sanitize_text(location_link.text.strip())
+                
+        return "Location not found"
+
+                
+    #Extraction of the job details
+    async def extract_job_details(self, job_id: str, fresh: bool = False) -> Dict:
+        """
+        Extract details from a single job posting.
+
+        Cached results are returned straight from the TTL cache; concurrent
+        calls for the same job_id coalesce on a per-id lock so only the first
+        one scrapes the page and the rest get the cached entry.
+
+        Args:
+            job_url: URL of the job posting
+            fresh: When True, bypass the TTL cache and re-scrape the page
+
+        Returns:
+            Dictionary containing job details (title, company, requirements, etc.)
+        """
+        if not fresh:
+            cached = _JOB_CACHE.get(job_id)
+            if cached is not None:
+                # Hand back a copy so callers can't mutate the cached entry
+                return dict(cached)
+
+        async with _job_lock(job_id):
+            # A task that held the lock first may have filled the cache
+            if not fresh:
+                cached = _JOB_CACHE.get(job_id)
+                if cached is not None:
+                    return dict(cached)
+            return await self._scrape_job_details(job_id)
+
+    async def _scrape_job_details(self, job_id: str) -> Dict: #once we have the job_url (defined later), the function will extract the details and added to a dictionary
+        """
+        Fetch one job page and build its detail dict (callers go through
+        extract_job_details, which handles caching and deduplication)
+        """
+        #the dictionary will be called job_details
+        # Built once up front so the error path below reuses it instead of
+        # re-formatting the same string
+        job_url = f"{self.base_url}/job/{job_id}"
+        try:
+
+            job_details = {
+                'url': job_url, 
+                'job_id': job_id
+            } #this first sentence will add the job_url to fetch de job page and the job id that is embeded in the url
+            
+            # Selenium path: one in-page JS call returns all the fields,
+            # skipping the page_source round-trip and the soup parse entirely
+            if self.use_selenium:
+                fields = await self._extract_with_selenium_js(job_url)
+                if fields and fields.get('job_title'):
+                    job_details['job_title'] = self.sanitize_text(fields['job_title'].strip())
+                    job_details['job_location'] = self.sanitize_text(fields['job_location'].strip()) if fields.get('job_location') else "Location not found"
+                    job_details['company'] = self.sanitize_text(fields['company'].strip()) if fields.get('company') else "Company not found"
+                    job_details['job_description'] = self.sanitize_text(fields['job_description'].strip()) if fields.get('job_description') else "Description not found"
+                    job_details['posting_time'] = self.sanitize_text(fields['posting_time']) if fields.get('posting_time') else "Posting time not found"
+                    job_details['job_type'] = self.categorize_job_type(job_details['job_title'])
+                    job_details['job_industry'] = self.sanitize_text(fields['job_industry'].strip()) if fields.get('job_industry') else "Industry not found"
+                    job_details['job_work_type'] = self.sanitize_text(fields['job_work_type'].strip()) if fields.get('job_work_type') else "Work type not found"
+
+                    _JOB_CACHE[job_id] = job_details
+                    return dict(job_details)
+                # JS extraction came back empty - fall through to the page
+                # fetch + parse path below
+
+            # API path: ask the GraphQL backend for the record directly and
+            # only fetch the full page when that doesn't pan out
+            if not self.use_selenium:
+                job = await self._fetch_via_api(job_id)
+                if job:
+                    try:
+                        self._map_job_record(job, job_details)
+                        _JOB_CACHE[job_id] = job_details
+                        return dict(job_details)
+                    except Exception as e:
+                        logger.warning("Error reading GraphQL payload, falling back to the page: %s", e)
+
+            # Fetch and parse the job page
+            soup = await self.fetch_page(job_url) #this will parse the whole page and if its not a soup object, it will return None
+            if not soup:
+                return None
+
+            # Fast path: read the job record straight out of __NEXT_DATA__
+            # instead of walking the DOM with seven select_one calls
+            job = self._job_from_next_data(soup)
+            if job:
+                try:
+                    self._map_job_record(job, job_details)
+                    _JOB_CACHE[job_id] = job_details
+                    return dict(job_details)
+                except Exception as e:
+                    logger.warning("Error reading __NEXT_DATA__ payload, falling back to HTML: %s", e)
+
+            # One pass over the tree collecting every data-automation element
+            # the fallback needs, instead of a full-tree selector per field.
+            # The walk is lazy and bails out once every target is found.
+            found = {}
+            for element in soup.descendants:
+                attrs = getattr(element, 'attrs', None)
+                if not attrs:
+                    continue
+                automation = attrs.get('data-automation')
+                if automation in self._DETAIL_TARGETS and automation not in found:
+                    found[automation] = element
+                    if len(found) == len(self._DETAIL_TARGETS):
+                        break
+
+            # Extract job title
+            try:
+                title_element = found.get('job-detail-title') or _SEL['class_title'].select_one(soup)
+                job_details['job_title'] = self.sanitize_text(title_element.text.strip() if title_element else "Title not found")
+            except Exception as e:
+                job_details['job_title'] = "Title not found"
+
+            #Extract Location
+            try:
+                job_details['job_location'] = self.extract_location(soup, container=found.get('job-detail-location'))
+                logger.debug("Location: %s", job_details['job_location'])
+            except Exception as e:
+                logger.warning("Error extracting location: %s", e)
+                job_details['job_location'] = "Location not found"
+
+
+            # Extract company name
+            try:
+                company_element = found.get('advertiser-name') or _SEL['class_company'].select_one(soup)
+                job_details['company'] = self.sanitize_text(company_element.text.strip() if company_element else "Company not found")
+            except Exception as e:
+                job_details['company'] = "Company not found"
+
+
+            # Extract job requirements/description
+            try:
+                description_element = found.get('jobAdDetails') or _SEL['class_description'].select_one(soup)
+                job_details['job_description'] = self.sanitize_text(description_element.text.strip() if description_element else "Description not found")
+            except Exception as e:
+                job_details['job_description'] = "Description not found"
+
+            # Extract posting time
+            try:
+                # Look for spans containing "Posted" text, inside the page
+                # container when the walk found it
+                details_page = found.get('jobDetailsPage')
+                if details_page is not None:
+                    # Lazy generator over the container's spans - stops
+                    # walking the tree as soon as a match breaks the loop
+                    posting_elements = (el for el in details_page.descendants
+                                        if getattr(el, 'name', None) == 'span')
+                else:
+                    posting_elements = _SEL['page_spans'].iselect(soup)
+                posting_time = "Posting time not found"
+
+                for element in posting_elements:
+                    text = element.text.strip()
+                    if _POSTED_SPAN_RE.match(text): #the span with the posted word and any of the Time letters
+                        posting_time = text
+                        break
+                         
+                job_details['posting_time'] = posting_time #Now it will be added to the dictionary
+            except Exception as e:
+                job_details['posting_time'] = "Posting time not found"
+
+
+            try: 
+                job_details['job_type'] = self.categorize_job_type(job_details['job_title'])
+                logger.debug("Job_type: %s", job_details['job_type'])
+            except Exception as e:
+                job_details['job_type'] = "unknown"
+
+
+            try:
+                job_industry_element = found.get('job-detail-classifications') or _SEL['class_title'].select_one(soup)
+                job_details['job_industry'] = self.sanitize_text(job_industry_element.text.strip() if job_industry_element else "Industry not found")
+            except Exception as e:
+                job_details['job_industry'] = "Industry not found"
+
+            try:
+                job_work_type_element = found.get('job-detail-work-type') or _SEL['class_title'].select_one(soup)
+                job_details['job_work_type'] = self.sanitize_text(job_work_type_element.text.strip() if job_work_type_element else "Work type not found")
+            except Exception as e:
+                job_details['job_work_type'] = "Work type not found"
+
+            _JOB_CACHE[job_id] = job_details
+            return dict(job_details) #returns the dictionary after finishing the extraction
+
+        except Exception as e:
+            logger.error("Error extracting job details: %s", e)
+            return {'url': job_url, 'job_id': job_id, 'error': str(e)}
+
+
+
+    
+    #Build a job_type categorization for the different job_types
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def categorize_job_type(job_title: str) -> str:
+        """
+        Categorize job types based on the job title
+
+        One search over the precompiled alternation replaces the old ladder
+        of per-category substring checks; repeat titles hit the lru_cache.
+        """
+        match = SeekJobCardsScraper._JOB_TYPE_RE.search(job_title)
+        if not match:
+            return "unknown"
+        return SeekJobCardsScraper._JOB_TYPE_LABELS[match.lastgroup]
+
+   
+
+
+# Creates a directory to save the results if it doesnt exists
+RESULTS_DIR = "results"
+os.makedirs(RESULTS_DIR, exist_ok=True)
+
+
+# Payloads above this size are split into per-chunk POSTs
+_WEBHOOK_CHUNK_BYTES = 1 << 20  # 1MB
+
+
+async def _post_gzipped(session: aiohttp.ClientSession, url: str, raw: bytes) -> dict:
+    """POST one gzip-compressed JSON body and report the webhook's reply"""
+    body = gzip.compress(raw)
+    headers = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+    async with session.post(url, data=body, headers=headers) as response:
+        response_text = await response.text()
+        return {
+            "status": "sent",
+            "webhook_status": response.status,
+            "webhook_response": response_text
+        }
+
+
+async def send_to_webhook(url: str, data: dict, session: aiohttp.ClientSession = None) -> dict:
+    """
+    Sends JSON data to a specified webhook URL using POST.
+
+    Bodies are gzip-compressed, and payloads over ~1MB are split into
+    per-chunk POSTs (each carrying a slice of the job list plus a chunk
+    index) sent concurrently, so large batches don't push one huge blob.
+
+    Args:
+        url (str): Webhook URL to send the data to.
+        data (dict): JSON-serializable data to send.
+        session: Optional shared aiohttp session; a throwaway one is
+            opened only when none is provided.
+
+    Returns:
+        dict: Response status and message.
+    """
+    try:
+        if session is None:
+            async with aiohttp.ClientSession() as temp_session:
+                return await send_to_webhook(url, data, session=temp_session)
+
+        raw = orjson.dumps(data)
+        jobs = data.get("data") if isinstance(data, dict) else None
+
+        # Small payloads (or anything without a splittable job list) go out
+        # as a single compressed POST
+        if len(raw) <= _WEBHOOK_CHUNK_BYTES or not isinstance(jobs, list) or len(jobs) <= 1:
+            return await _post_gzipped(session, url, raw)
+
+        # Split the job list into roughly chunk-sized parts and POST them
+        # concurrently
+        parts = -(-len(raw) // _WEBHOOK_CHUNK_BYTES)
+        per_chunk = -(-len(jobs) // parts)
+        chunks = [jobs[i:i + per_chunk] for i in range(0, len(jobs), per_chunk)]
+
+        payloads = []
+        for index, chunk in enumerate(chunks):
+            payload = dict(data)
+            payload["data"] = chunk
+            payload["job_count"] = len(chunk)
+            payload["chunk"] = {"index": index, "total": len(chunks)}
+            payloads.append(orjson.dumps(payload))
+
+        results = await asyncio.gather(
+            *(_post_gzipped(session, url, payload) for payload in payloads)
+        )
+        return {
+            "status": "sent",
+            "chunks": len(results),
+            "webhook_status": [result.get("webhook_status") for result in results]
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+
+async def background_scrape_and_send(job_ids: List[str], webhook_url: str):
+    async with SeekJobCardsScraper(session=getattr(app.state, 'http', None)) as scraper:
+        all_jobs_data = []
+        # Dispatch every job id concurrently instead of one page load at a time
+        tasks = [scraper.extract_job_details(str(job_id)) for job_id in job_ids]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for job_data in results:
+            if isinstance(job_data, Exception):
+                logger.warning("Error scraping job: %s", job_data)
+                continue
+            if job_data:
+                # Fields are sanitized at extraction time, so no re-serialization pass
+                all_jobs_data.append(job_data)
+
+        webhook_payload = {
+            "status": "success",
+            "job_count": len(all_jobs_data),
+            "data": all_jobs_data,
+            # One timestamp per batch; utcnow() is deprecated and naive
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        await send_to_webhook(webhook_url, webhook_payload, session=getattr(app.state, 'http', None))
+
+
+# Define the API endpoints
+
+@app.on_event("startup")
+async def startup_http_session():
+    """Create the shared aiohttp session and warm up the Seek cookies once"""
+    connector = aiohttp.TCPConnector(
+        limit=64, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=30, connect=5, sock_read=15)
+    # trust_env picks up HTTPS_PROXY and friends, so proxies can be rotated
+    # from the environment without touching the code
+    app.state.http = aiohttp.ClientSession(
+        connector=connector, timeout=timeout, trust_env=True)
+
+    # One cookie warmup for the whole process instead of one per request
+    try:
+        async with app.state.http.get("https://www.seek.com.au") as response:
+            if response.status == 200:
+                logger.info("Successfully initialized shared session with cookies")
+    except Exception as e:
+        logger.warning("Error warming up shared session: %s", e)
+
+    # Opt-in: spawn the whole driver pool up front for selenium-heavy
+    # deployments so the first requests skip Chrome startup
+    if os.environ.get("SELENIUM_PREWARM") == "1":
+        try:
+            await DRIVER_POOL.prewarm()
+            logger.info("Pre-warmed %d selenium drivers", DRIVER_POOL.size)
+        except Exception as e:
+            logger.warning("Error pre-warming selenium drivers: %s", e)
+
+
+@app.on_event("shutdown")
+async def shutdown_http_session():
+    """Close the shared aiohttp session and quit any pooled drivers"""
+    await app.state.http.close()
+    DRIVER_POOL.shutdown()
+    _SELENIUM_EXECUTOR.shutdown(wait=False)
+
+
+@app.get("/")
+async def root():
+    """Root endpoint that returns basic API information"""
+    return {
+        "message": "Welcome to the Seek Job Cards Scraper API",
+        "version": "1.0.0",
+        "endpoints": {
+            "/scrape": "POST - Scrape job cards based on search criteria and return results",
+            "/health": "GET - Check API health status"
+        }
+    }
+
+@app.get("/health_jc")
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+
+# Scrape endpoint
+@app.post("/scrape_jc")
+async def scrape_job_cards_endpoint(request: JobSearchRequest, fresh: bool = Query(False)):
+    """
+    Endpoint to scrape the details of a single job ID
+
+    Returns the scraped job details directly in the response. Lists of IDs
+    go to /scrape_batch_jc.
+    """
+    try:
+        start_time = time.monotonic()
+        all_jobs_data = [] # Initialize a list to hold all scraped job data
+
+        # Run the scraper - the request model carries one job_id (the old
+        # code iterated a job_ids attribute this model never had)
+        async with SeekJobCardsScraper(session=app.state.http) as scraper:
+            job_data = await scraper.extract_job_details(str(request.job_id), fresh=fresh)
+            if job_data:
+                all_jobs_data.append(job_data)
+
+        elapsed_time = time.monotonic() - start_time
+
+        return {
+            "status": "success",
+            "job_count": len(all_jobs_data),
+            "data": all_jobs_data,
+            "elapsed_time": f"{elapsed_time:.2f} seconds"
+        }
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Scraping failed: {str(e)}"
+        )
+    
+@app.post("/scrape_batch_jc")
+async def scrape_job_cards_batch_endpoint(
+    request: JobSearchResponseBatch,
+    fresh: bool = Query(False),
+    aggregate: bool = Query(False)):
+    """
+    Scrape a batch of job IDs.
+
+    By default jobs are streamed back as NDJSON in completion order, so the
+    first line arrives as soon as the fastest job finishes instead of after
+    the slowest. Pass ?aggregate=true for the old single-JSON-blob shape.
+    """
+    if not aggregate:
+        async def ndjson_stream():
+            async with SeekJobCardsScraper(session=app.state.http) as scraper:
+                tasks = [
+                    asyncio.ensure_future(scraper.extract_job_details(str(job_id), fresh=fresh))
+                    for job_id in request.job_ids
+                ]
+                try:
+                    for finished in asyncio.as_completed(tasks):
+                        try:
+                            job_data = await finished
+                        except Exception as e:
+                            yield orjson.dumps({"error": str(e)}) + b"\n"
+                            continue
+                        if job_data:
+                            yield orjson.dumps(job_data) + b"\n"
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+        return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+    try:
+        start_time = time.monotonic()
+        all_jobs_data = []  # Initialize a list to hold all scraped job data
+
+        async with SeekJobCardsScraper(session=app.state.http) as scraper:
+            # Dispatch every job_id in the request concurrently
+            tasks = [scraper.extract_job_details(str(job_id), fresh=fresh) for job_id in request.job_ids]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for job_data in results:
+                if isinstance(job_data, Exception):
+                    logger.warning("Error scraping job: %s", job_data)
+                    continue
+                if job_data:
+                    all_jobs_data.append(job_data)
+        elapsed_time = time.monotonic() - start_time
+
+        return {
+            "status": "success",
+            "job_count": len(all_jobs_data),
+            "data": all_jobs_data,
+            "elapsed_time": f"{elapsed_time:.2f} seconds"
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Scraping failed: {str(e)}"
+        )   
+
+@app.post("/scrape_webhook_jc")
+async def scrape_and_send_to_webhook(
+    request: WebhookJobSearchRequest,
+    background_tasks: BackgroundTasks
+):
+    background_tasks.add_task(background_scrape_and_send, request.job_ids, str(request.webhook_url))
+    return {
+        "status": "accepted",
+        "message": "Scraping started and webhook will be called asynchronously"
+    }
+    
+
+if __name__ == "__main__":
+    # Determine port - use environment variable if available
+    port = int(os.environ.get("PORT", 8080))
+    
+    # Run the API server on uvloop + httptools when installed
+    uvicorn.run(
+        "seek_job_cards_scraper:app",
+        host="0.0.0.0",
+        port=port,
+        reload=False,
+        loop="uvloop" if uvloop else "auto",
+        http="httptools"
+    )
+
+# Run server manually
 ## uvicorn seek_job_cards_scraper:app --reload
\ No newline at end of file